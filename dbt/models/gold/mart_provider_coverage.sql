@@ -31,7 +31,7 @@ calls as (
 pages as (
   select
     provider_id,
-    count(*) filter (where http_status=200) as products_pages_ok,
+    count(*) filter (where http_status in (200, 304)) as products_pages_ok,
     max(http_status) as last_http_status
   from {{ source('raw','products_raw') }}
   where fetched_at::date = (select as_of_date from latest_day)
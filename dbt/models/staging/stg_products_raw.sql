@@ -13,7 +13,8 @@ with src as (
     fetched_at::date as as_of_date,
     payload
   from {{ source('raw','products_raw') }}
-  where http_status = 200
+  -- 304 rows carry the unchanged payload copied from the previous fetch
+  where http_status in (200, 304)
 ),
 products as (
   select
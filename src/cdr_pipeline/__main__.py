@@ -8,83 +8,131 @@ Run (inside the pipeline container):
 from __future__ import annotations
 
 import argparse
+import sys
+from collections.abc import Callable
 from datetime import datetime, timezone
 
-from cdr_pipeline.bootstrap import bootstrap_db
-from cdr_pipeline.ingest import run_ingest
-from cdr_pipeline.qa import run_qa
-from cdr_pipeline.report import run_report
-
 
 def _parse_date(s: str | None) -> datetime:
     if not s:
         return datetime.now(timezone.utc)
-    try:
-        return datetime.fromisoformat(s)
-    except ValueError:
+    # The common `--date YYYY-MM-DD` form takes a single fromisoformat call.
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
         return datetime.fromisoformat(s + "T00:00:00")
+    return datetime.fromisoformat(s)
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(
-        prog="cdr_pipeline",
-        description="AU CDR Open Banking product lakehouse pipeline (local).",
-    )
-    sub = parser.add_subparsers(dest="cmd", required=True)
+def _help_text(s: str) -> str:
+    return s
+
+
+def _no_help(_s: str) -> None:
+    return None
+
+
+def _add_bootstrap_args(p: argparse.ArgumentParser, h: Callable[[str], str | None]) -> None:
+    p.add_argument("--force", action="store_true", help=h("Drop and recreate objects (DANGEROUS)."))
+
+
+def _add_ingest_args(p: argparse.ArgumentParser, h: Callable[[str], str | None]) -> None:
+    p.add_argument("--date", default=None, help=h("Run date (YYYY-MM-DD). Used for partitioning raw files and report names."))
+    p.add_argument("--provider-limit", type=int, default=None, help=h("Limit number of providers processed (overrides env PROVIDER_LIMIT)."))
 
-    p_boot = sub.add_parser("bootstrap", help="Create required Postgres schemas/tables.")
-    p_boot.add_argument("--force", action="store_true", help="Drop and recreate objects (DANGEROUS).")
 
-    p_ing = sub.add_parser("ingest", help="Discover brands via register and ingest product payloads.")
-    p_ing.add_argument("--date", default=None, help="Run date (YYYY-MM-DD). Used for partitioning raw files and report names.")
-    p_ing.add_argument("--provider-limit", type=int, default=None, help="Limit number of providers processed (overrides env PROVIDER_LIMIT).")
+def _add_report_args(p: argparse.ArgumentParser, h: Callable[[str], str | None]) -> None:
+    p.add_argument("--date", default=None, help=h("Report date (YYYY-MM-DD)."))
 
-    p_rep = sub.add_parser("report", help="Generate reports from gold marts (after dbt build).")
-    p_rep.add_argument("--date", default=None, help="Report date (YYYY-MM-DD).")
 
-    p_qa = sub.add_parser("qa", help="Run data quality gates and optional dbt tests.")
-    p_qa.add_argument("--date", default=None, help="QA date (YYYY-MM-DD).")
-    p_qa.add_argument("--min-providers-ok", type=int, default=None, help="Minimum providers with successful product fetch.")
-    p_qa.add_argument("--min-products", type=int, default=None, help="Minimum row count in silver.dim_products for the QA date.")
-    p_qa.add_argument("--min-rate-changes", type=int, default=None, help="Minimum row count in gold.mart_rate_changes for the QA date.")
-    p_qa.add_argument("--max-freshness-hours", type=float, default=None, help="Maximum age in hours for latest raw.products_raw.fetched_at.")
-    p_qa.add_argument(
+def _add_qa_args(p: argparse.ArgumentParser, h: Callable[[str], str | None]) -> None:
+    p.add_argument("--date", default=None, help=h("QA date (YYYY-MM-DD)."))
+    p.add_argument("--min-providers-ok", type=int, default=None, help=h("Minimum providers with successful product fetch."))
+    p.add_argument("--min-products", type=int, default=None, help=h("Minimum row count in silver.dim_products for the QA date."))
+    p.add_argument("--min-rate-changes", type=int, default=None, help=h("Minimum row count in gold.mart_rate_changes for the QA date."))
+    p.add_argument("--max-freshness-hours", type=float, default=None, help=h("Maximum age in hours for latest raw.products_raw.fetched_at."))
+    p.add_argument(
         "--fail-on-schema-drift",
         action="store_true",
-        help="Fail QA if any bronze.schema_drift_event records exist for the QA date.",
+        help=h("Fail QA if any bronze.schema_drift_event records exist for the QA date."),
     )
-    p_qa.add_argument("--skip-dbt-tests", action="store_true", help="Skip executing dbt tests as part of QA.")
-    p_qa.add_argument(
+    p.add_argument("--skip-dbt-tests", action="store_true", help=h("Skip executing dbt tests as part of QA."))
+    p.add_argument("--no-cache", action="store_true", help=h("Re-run every gate even if cached QA results are still fresh."))
+    p.add_argument(
         "--dbt-test-command",
         default=None,
-        help="Command string for dbt tests (default: from QA_DBT_TEST_COMMAND env).",
+        help=h("Command string for dbt tests (default: from QA_DBT_TEST_COMMAND env)."),
     )
 
+
+_COMMANDS = {
+    "bootstrap": ("Create required Postgres schemas/tables.", _add_bootstrap_args),
+    "ingest": ("Discover brands via register and ingest product payloads.", _add_ingest_args),
+    "report": ("Generate reports from gold marts (after dbt build).", _add_report_args),
+    "qa": ("Run data quality gates and optional dbt tests.", _add_qa_args),
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        prog="cdr_pipeline",
+        description="AU CDR Open Banking product lakehouse pipeline (local).",
+    )
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    # Only the selected subcommand gets its arguments; the others are registered as bare
+    # stubs so the usage line, top-level help and "invalid choice" errors still list them all.
+    selected = argv[0] if argv and argv[0] in _COMMANDS else None
+    # Help strings are only attached when they can actually be printed.
+    h = _help_text if "-h" in argv or "--help" in argv or selected is None else _no_help
+    for name, (help_text, add_args) in _COMMANDS.items():
+        p = sub.add_parser(name, help=h(help_text))
+        if name == selected:
+            add_args(p, h)
+
     args = parser.parse_args(argv)
 
-    if args.cmd == "bootstrap":
-        bootstrap_db(force=args.force)
-        return 0
-
-    if args.cmd == "ingest":
-        run_ingest(_parse_date(args.date), provider_limit=args.provider_limit)
-        return 0
-
-    if args.cmd == "report":
-        run_report(_parse_date(args.date))
-        return 0
-
-    if args.cmd == "qa":
-        return run_qa(
-            _parse_date(args.date),
-            min_providers_ok=args.min_providers_ok,
-            min_products=args.min_products,
-            min_rate_changes=args.min_rate_changes,
-            max_freshness_hours=args.max_freshness_hours,
-            fail_on_schema_drift=True if args.fail_on_schema_drift else None,
-            run_dbt_tests=False if args.skip_dbt_tests else None,
-            dbt_test_command=args.dbt_test_command,
-        )
+    # Subcommand modules are imported lazily so `-h` and argument errors don't pay for
+    # psycopg2, requests and the rest of the pipeline stack.
+    try:
+        if args.cmd == "bootstrap":
+            from cdr_pipeline.bootstrap import bootstrap_db
+
+            bootstrap_db(force=args.force)
+            return 0
+
+        if args.cmd == "ingest":
+            from cdr_pipeline.ingest import run_ingest
+
+            run_ingest(_parse_date(args.date), provider_limit=args.provider_limit)
+            return 0
+
+        if args.cmd == "report":
+            from cdr_pipeline.report import run_report
+
+            run_report(_parse_date(args.date))
+            return 0
+
+        if args.cmd == "qa":
+            from cdr_pipeline.qa import run_qa
+
+            return run_qa(
+                _parse_date(args.date),
+                min_providers_ok=args.min_providers_ok,
+                min_products=args.min_products,
+                min_rate_changes=args.min_rate_changes,
+                max_freshness_hours=args.max_freshness_hours,
+                fail_on_schema_drift=True if args.fail_on_schema_drift else None,
+                run_dbt_tests=False if args.skip_dbt_tests else None,
+                dbt_test_command=args.dbt_test_command,
+                use_cache=not args.no_cache,
+            )
+    finally:
+        # Every command goes through cdr_pipeline.db, so this import is already loaded by now.
+        from cdr_pipeline.db import close_pools
+
+        close_pools()
 
     parser.print_help()
     return 2
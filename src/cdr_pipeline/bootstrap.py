@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import logging
-from contextlib import closing
 
 from cdr_pipeline.config import Config
-from cdr_pipeline.db import connect_with_retries, execute, transaction
+from cdr_pipeline.db import execute, pooled, transaction
 
 logger = logging.getLogger(__name__)
 
@@ -116,19 +115,57 @@ CREATE TABLE IF NOT EXISTS bronze.qa_gate_result (
     dbt_test_command text,
     PRIMARY KEY (qa_run_id, gate_name)
 );
+
+-- Access paths for QA freshness (max(fetched_at)), ETag lookups for conditional GETs and drift
+-- lookups. Per-run/provider reads already use the products_raw primary key.
+CREATE INDEX IF NOT EXISTS ix_products_raw_fetched_at ON raw.products_raw (fetched_at);
+CREATE INDEX IF NOT EXISTS ix_products_raw_provider_url ON raw.products_raw (provider_id, endpoint, url, fetched_at);
+CREATE INDEX IF NOT EXISTS ix_product_detail_raw_provider_product ON raw.product_detail_raw (provider_id, product_id, fetched_at);
+CREATE INDEX IF NOT EXISTS ix_api_call_log_fetched_at ON bronze.api_call_log (fetched_at);
+CREATE INDEX IF NOT EXISTS ix_schema_drift_observed_at ON bronze.schema_drift_event (observed_at);
+-- jsonb_path_ops serves containment lookups such as industries @> '["banking"]'.
+CREATE INDEX IF NOT EXISTS ix_dhb_industries ON bronze.data_holder_brand USING GIN (industries jsonb_path_ops);
+
+-- LZ4 TOAST compression for the large jsonb columns (PostgreSQL 14+ built with lz4). Columns that
+-- already use it are skipped so routine bootstraps don't take ACCESS EXCLUSIVE locks.
+DO $$
+DECLARE
+    col record;
+BEGIN
+    IF current_setting('server_version_num')::int < 140000 THEN
+        RETURN;
+    END IF;
+    FOR col IN
+        SELECT a.attrelid::regclass AS rel, a.attname
+        FROM pg_attribute a
+        JOIN pg_class c ON c.oid = a.attrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE (n.nspname, c.relname, a.attname) IN (
+            ('raw', 'products_raw', 'payload'),
+            ('raw', 'product_detail_raw', 'payload'),
+            ('bronze', 'data_holder_brand', 'industries')
+        )
+          AND a.attcompression IS DISTINCT FROM 'l'
+    LOOP
+        EXECUTE format('ALTER TABLE %s ALTER COLUMN %I SET COMPRESSION lz4', col.rel, col.attname);
+    END LOOP;
+EXCEPTION
+    WHEN feature_not_supported THEN
+        RAISE NOTICE 'lz4 TOAST compression unavailable; keeping the server default';
+END
+$$;
+"""
+
+DROP_DDL = """
+DROP SCHEMA IF EXISTS gold, silver, staging, raw, bronze CASCADE;
 """
 
 
 def bootstrap_db(force: bool = False) -> None:
     cfg = Config.from_env()
-    with closing(connect_with_retries(cfg.pg_dsn(), autocommit=False)) as conn, transaction(conn):
+    with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn, transaction(conn):
         if force:
             logger.warning("FORCE: dropping schemas (deletes all data).")
-            execute(conn, "DROP SCHEMA IF EXISTS gold CASCADE;")
-            execute(conn, "DROP SCHEMA IF EXISTS silver CASCADE;")
-            execute(conn, "DROP SCHEMA IF EXISTS staging CASCADE;")
-            execute(conn, "DROP SCHEMA IF EXISTS raw CASCADE;")
-            execute(conn, "DROP SCHEMA IF EXISTS bronze CASCADE;")
-
-        execute(conn, DDL)
+        # One multi-statement round-trip instead of one execute per DROP plus the DDL.
+        execute(conn, DROP_DDL + DDL if force else DDL)
     logger.info("Bootstrapped Postgres schemas/tables.")
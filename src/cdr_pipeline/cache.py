@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from typing import Any
+
+import orjson
+
+# Small JSON result cache: one file per key under a cache directory, fronted by an in-process dict.
+_memory: dict[str, tuple[float, Any]] = {}
+_memory_lock = threading.Lock()
+
+
+def cache_key(*parts: Any) -> str:
+    return hashlib.sha256(orjson.dumps(parts, default=str)).hexdigest()
+
+
+def _entry_path(directory: str, key: str) -> str:
+    return os.path.join(directory, f"{key}.json")
+
+
+def load(directory: str, key: str, ttl_seconds: float) -> Any | None:
+    path = _entry_path(directory, key)
+    with _memory_lock:
+        entry = _memory.get(path)
+    if entry is None:
+        try:
+            with open(path, "rb") as f:
+                raw = orjson.loads(f.read())
+            entry = (float(raw["stored_at"]), raw["value"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        with _memory_lock:
+            _memory[path] = entry
+    stored_at, value = entry
+    if time.time() - stored_at > ttl_seconds:
+        return None
+    # Refresh the mtime so max_entries pruning evicts the least recently used entries first.
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return value
+
+
+def store(directory: str, key: str, value: Any, ttl_seconds: float, max_entries: int | None = None) -> None:
+    os.makedirs(directory, exist_ok=True)
+    now = time.time()
+    path = _entry_path(directory, key)
+    # Write-then-rename so a concurrent reader never sees a half-written entry.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps({"stored_at": now, "value": value}))
+    os.replace(tmp_path, path)
+    with _memory_lock:
+        _memory[path] = (now, value)
+    _prune(directory, now - ttl_seconds, max_entries)
+
+
+def _prune(directory: str, cutoff: float, max_entries: int | None) -> None:
+    kept: list[tuple[float, str]] = []
+    evict: list[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if mtime < cutoff:
+                evict.append(entry.path)
+            else:
+                kept.append((mtime, entry.path))
+    if max_entries is not None and len(kept) > max_entries:
+        kept.sort()
+        evict.extend(path for _mtime, path in kept[: len(kept) - max_entries])
+    for path in evict:
+        with _memory_lock:
+            _memory.pop(path, None)
+        try:
+            os.remove(path)
+        except OSError:
+            continue
@@ -1,66 +1,48 @@
 from __future__ import annotations
 
+import functools
 import os
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
+_TRUE = frozenset({"1", "true", "yes", "y"})
+_FALSE = frozenset({"0", "false", "no", "n"})
 
-def _getenv(name: str, default: str | None = None) -> str | None:
-    val = os.getenv(name)
-    if val is None or val == "":
-        return default
-    return val
 
+def _is_int_literal(part: str) -> bool:
+    digits = part[1:] if part[:1] in ("+", "-") else part
+    return digits.isdecimal()
 
-def _parse_csv_ints(s: str | None) -> list[int]:
+
+def _parse_csv_ints(s: str | None) -> tuple[int, ...]:
     if not s:
-        return []
-    out: list[int] = []
-    for part in s.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        try:
-            out.append(int(part))
-        except ValueError:
-            continue
-    return out
-
-
-def _require_int(name: str, default: str) -> int:
-    raw = _getenv(name, default)
-    assert raw is not None
-    try:
-        return int(raw)
-    except ValueError as e:
-        raise ValueError(f"Environment variable {name} must be an integer, got: {raw!r}") from e
+        return ()
+    parts = (part.strip() for part in s.split(","))
+    return tuple(int(part) for part in parts if _is_int_literal(part))
 
 
-def _require_float(name: str, default: str) -> float:
-    raw = _getenv(name, default)
-    assert raw is not None
-    try:
-        return float(raw)
-    except ValueError as e:
-        raise ValueError(f"Environment variable {name} must be a float, got: {raw!r}") from e
+def _parse_bool(raw: str) -> bool:
+    raw = raw.strip().lower()
+    if raw in _TRUE:
+        return True
+    if raw in _FALSE:
+        return False
+    raise ValueError(raw)
 
 
-def _parse_optional_int(name: str) -> int | None:
-    raw = _getenv(name, None)
-    if raw is None:
-        return None
-    try:
-        return int(raw)
-    except ValueError as e:
-        raise ValueError(f"Environment variable {name} must be an integer if set, got: {raw!r}") from e
+def _strip_url(raw: str) -> str:
+    return raw.rstrip("/")
 
 
-def _parse_bool(name: str, default: str = "false") -> bool:
-    raw = (_getenv(name, default) or default).strip().lower()
-    if raw in ("1", "true", "yes", "y"):
-        return True
-    if raw in ("0", "false", "no", "n"):
-        return False
-    raise ValueError(f"Environment variable {name} must be a boolean value, got: {raw!r}")
+_KINDS: dict[Callable[[str], Any], str] = {int: "an integer", float: "a float", _parse_bool: "a boolean value"}
+
+
+def _coerce(name: str, raw: str, ctor: Callable[[str], Any]) -> Any:
+    try:
+        return ctor(raw)
+    except ValueError as e:
+        raise ValueError(f"Environment variable {name} must be {_KINDS.get(ctor, ctor.__name__)}, got: {raw!r}") from e
 
 
 @dataclass(frozen=True)
@@ -70,28 +52,32 @@ class Config:
     pg_db: str
     pg_user: str
     pg_password: str
+    pg_pool_max: int
 
     register_base: str
     register_industry: str
     filter_industry: str
     register_xv: int
-    register_xv_fallback: list[int]
+    register_xv_fallback: tuple[int, ...]
 
     products_path: str
     products_xv: int
-    products_xv_fallback: list[int]
+    products_xv_fallback: tuple[int, ...]
 
     product_detail_path: str
     product_detail_xv: int
-    product_detail_xv_fallback: list[int]
+    product_detail_xv_fallback: tuple[int, ...]
 
     timeout_seconds: int
     retry_total: int
     retry_backoff: float
     user_agent: str
     fetch_product_details: bool
+    product_detail_concurrency: int
+    etag_max_age_hours: float
     provider_limit: int | None
     max_pages_per_provider: int
+    ingest_workers: int
     qa_min_providers_ok: int
     qa_min_products: int
     qa_min_rate_changes: int
@@ -99,48 +85,75 @@ class Config:
     qa_fail_on_schema_drift: bool
     qa_run_dbt_tests: bool
     qa_dbt_test_command: str
+    qa_dbt_isolated: bool
+    qa_dbt_threads: int
+    qa_dbt_cache_enabled: bool
+    qa_parallel_gates: bool
+    qa_cache_ttl_seconds: float
+    report_rate_changes_csv: bool
 
     @staticmethod
     def from_env() -> Config:
-        provider_limit = _parse_optional_int("PROVIDER_LIMIT")
-
-        return Config(
-            pg_host=_getenv("POSTGRES_HOST", "localhost") or "localhost",
-            pg_port=_require_int("POSTGRES_PORT", "5432"),
-            pg_db=_getenv("POSTGRES_DB", "cdr") or "cdr",
-            pg_user=_getenv("POSTGRES_USER", "cdr") or "cdr",
-            pg_password=_getenv("POSTGRES_PASSWORD", "cdr") or "cdr",
-
-            register_base=(_getenv("CDR_REGISTER_BASE", "https://api.cdr.gov.au") or "https://api.cdr.gov.au").rstrip("/"),
-            register_industry=_getenv("CDR_REGISTER_INDUSTRY", "all") or "all",
-            filter_industry=_getenv("CDR_FILTER_INDUSTRY", "banking") or "banking",
-            register_xv=_require_int("CDR_REGISTER_XV", "2"),
-            register_xv_fallback=_parse_csv_ints(_getenv("CDR_REGISTER_XV_FALLBACK", "1")),
-
-            products_path=_getenv("CDR_PRODUCTS_PATH", "/cds-au/v1/banking/products") or "/cds-au/v1/banking/products",
-            products_xv=_require_int("CDR_PRODUCTS_XV", "4"),
-            products_xv_fallback=_parse_csv_ints(_getenv("CDR_PRODUCTS_XV_FALLBACK", "3,2,1")),
-
-            product_detail_path=_getenv("CDR_PRODUCT_DETAIL_PATH", "/cds-au/v1/banking/products/{productId}") or "/cds-au/v1/banking/products/{productId}",
-            product_detail_xv=_require_int("CDR_PRODUCT_DETAIL_XV", "6"),
-            product_detail_xv_fallback=_parse_csv_ints(_getenv("CDR_PRODUCT_DETAIL_XV_FALLBACK", "5,4,3,2,1")),
-
-            timeout_seconds=_require_int("HTTP_TIMEOUT_SECONDS", "30"),
-            retry_total=_require_int("HTTP_RETRY_TOTAL", "5"),
-            retry_backoff=_require_float("HTTP_RETRY_BACKOFF", "0.4"),
-            user_agent=_getenv("HTTP_USER_AGENT", "cdr-open-banking-lakehouse-local/1.0") or "cdr-open-banking-lakehouse-local/1.0",
-            fetch_product_details=_parse_bool("FETCH_PRODUCT_DETAILS", "false"),
-            provider_limit=provider_limit,
-            max_pages_per_provider=_require_int("MAX_PAGES_PER_PROVIDER", "200"),
-            qa_min_providers_ok=_require_int("QA_MIN_PROVIDERS_OK", "1"),
-            qa_min_products=_require_int("QA_MIN_PRODUCTS", "1"),
-            qa_min_rate_changes=_require_int("QA_MIN_RATE_CHANGES", "1"),
-            qa_max_freshness_hours=_require_float("QA_MAX_FRESHNESS_HOURS", "36"),
-            qa_fail_on_schema_drift=_parse_bool("QA_FAIL_ON_SCHEMA_DRIFT", "false"),
-            qa_run_dbt_tests=_parse_bool("QA_RUN_DBT_TESTS", "true"),
-            qa_dbt_test_command=_getenv("QA_DBT_TEST_COMMAND", "dbt test --project-dir dbt --profiles-dir dbt")
-            or "dbt test --project-dir dbt --profiles-dir dbt",
-        )
+        return _config_from_env()
+
+    @staticmethod
+    def reset_cache() -> None:
+        _config_from_env.cache_clear()
 
     def pg_dsn(self) -> str:
         return f"dbname={self.pg_db} user={self.pg_user} password={self.pg_password} host={self.pg_host} port={self.pg_port}"
+
+
+# (Config field, environment variable, parser, default). Unset or empty variables fall back to the
+# default; a None default leaves the field None.
+_FIELDS: tuple[tuple[str, str, Callable[[str], Any], str | None], ...] = (
+    ("pg_host", "POSTGRES_HOST", str, "localhost"),
+    ("pg_port", "POSTGRES_PORT", int, "5432"),
+    ("pg_db", "POSTGRES_DB", str, "cdr"),
+    ("pg_user", "POSTGRES_USER", str, "cdr"),
+    ("pg_password", "POSTGRES_PASSWORD", str, "cdr"),
+    ("pg_pool_max", "POSTGRES_POOL_MAX", int, "4"),
+    ("register_base", "CDR_REGISTER_BASE", _strip_url, "https://api.cdr.gov.au"),
+    ("register_industry", "CDR_REGISTER_INDUSTRY", str, "all"),
+    ("filter_industry", "CDR_FILTER_INDUSTRY", str, "banking"),
+    ("register_xv", "CDR_REGISTER_XV", int, "2"),
+    ("register_xv_fallback", "CDR_REGISTER_XV_FALLBACK", _parse_csv_ints, "1"),
+    ("products_path", "CDR_PRODUCTS_PATH", str, "/cds-au/v1/banking/products"),
+    ("products_xv", "CDR_PRODUCTS_XV", int, "4"),
+    ("products_xv_fallback", "CDR_PRODUCTS_XV_FALLBACK", _parse_csv_ints, "3,2,1"),
+    ("product_detail_path", "CDR_PRODUCT_DETAIL_PATH", str, "/cds-au/v1/banking/products/{productId}"),
+    ("product_detail_xv", "CDR_PRODUCT_DETAIL_XV", int, "6"),
+    ("product_detail_xv_fallback", "CDR_PRODUCT_DETAIL_XV_FALLBACK", _parse_csv_ints, "5,4,3,2,1"),
+    ("timeout_seconds", "HTTP_TIMEOUT_SECONDS", int, "30"),
+    ("retry_total", "HTTP_RETRY_TOTAL", int, "5"),
+    ("retry_backoff", "HTTP_RETRY_BACKOFF", float, "0.4"),
+    ("user_agent", "HTTP_USER_AGENT", str, "cdr-open-banking-lakehouse-local/1.0"),
+    ("fetch_product_details", "FETCH_PRODUCT_DETAILS", _parse_bool, "false"),
+    ("product_detail_concurrency", "PRODUCT_DETAIL_CONCURRENCY", int, "4"),
+    ("etag_max_age_hours", "ETAG_MAX_AGE_HOURS", float, "72"),
+    ("provider_limit", "PROVIDER_LIMIT", int, None),
+    ("max_pages_per_provider", "MAX_PAGES_PER_PROVIDER", int, "200"),
+    ("ingest_workers", "INGEST_WORKERS", int, "4"),
+    ("qa_min_providers_ok", "QA_MIN_PROVIDERS_OK", int, "1"),
+    ("qa_min_products", "QA_MIN_PRODUCTS", int, "1"),
+    ("qa_min_rate_changes", "QA_MIN_RATE_CHANGES", int, "1"),
+    ("qa_max_freshness_hours", "QA_MAX_FRESHNESS_HOURS", float, "36"),
+    ("qa_fail_on_schema_drift", "QA_FAIL_ON_SCHEMA_DRIFT", _parse_bool, "false"),
+    ("qa_run_dbt_tests", "QA_RUN_DBT_TESTS", _parse_bool, "true"),
+    ("qa_dbt_test_command", "QA_DBT_TEST_COMMAND", str, "dbt test --project-dir dbt --profiles-dir dbt"),
+    ("qa_dbt_isolated", "QA_DBT_ISOLATED", _parse_bool, "false"),
+    ("qa_dbt_threads", "QA_DBT_THREADS", int, "8"),
+    ("qa_dbt_cache_enabled", "QA_DBT_CACHE_ENABLED", _parse_bool, "false"),
+    ("qa_parallel_gates", "QA_PARALLEL_GATES", _parse_bool, "true"),
+    ("qa_cache_ttl_seconds", "QA_CACHE_TTL_SECONDS", float, "3600"),
+    ("report_rate_changes_csv", "REPORT_RATE_CHANGES_CSV", _parse_bool, "true"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _config_from_env() -> Config:
+    values: dict[str, Any] = {}
+    for field, env_name, ctor, default in _FIELDS:
+        raw = os.environ.get(env_name) or default
+        values[field] = None if raw is None else _coerce(env_name, raw, ctor)
+    return Config(**values)
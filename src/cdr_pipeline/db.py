@@ -1,55 +1,188 @@
 from __future__ import annotations
 
+import itertools
+import random
+import threading
 import time
-from collections.abc import Iterable, Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from typing import Any
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 
 
-def connect_with_retries(
-    dsn: str,
-    retries: int = 30,
-    sleep_seconds: float = 1.0,
-    autocommit: bool = False,
-):
+class _Connection(psycopg2.extensions.connection):
+    # Plain psycopg2 connections reject new attributes; this subclass lets execute()/fetchall()
+    # keep one reusable cursor, and prepare() its statement names, on the connection.
+    _cdr_cursor: psycopg2.extensions.cursor | None = None
+    _cdr_prepared: set[str] | None = None
+
+
+# libpq connection options: bound a hung connect, label the sessions in pg_stat_activity and
+# let TCP keepalives notice dead peers during long ingest runs.
+_CONNECT_KWARGS: dict[str, Any] = {
+    "connect_timeout": 5,
+    "application_name": "cdr_pipeline",
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
+_MAX_RETRY_SLEEP_SECONDS = 30.0
+
+
+def _with_retries(connect: Callable[[], Any], retries: int, sleep_seconds: float) -> Any:
     last_err: Exception | None = None
-    for _ in range(retries):
+    for attempt in range(retries):
         try:
-            conn = psycopg2.connect(dsn)
-            conn.autocommit = autocommit
-            return conn
-        except Exception as e:  # noqa: BLE001
+            return connect()
+        except psycopg2.OperationalError as e:
             last_err = e
-            time.sleep(sleep_seconds)
+            if attempt + 1 < retries:
+                # Exponential backoff with jitter, capped so a long outage still retries regularly.
+                delay = min(_MAX_RETRY_SLEEP_SECONDS, sleep_seconds * (2**attempt))
+                time.sleep(delay + random.uniform(0, 0.25))
     raise RuntimeError(f"Failed to connect to Postgres after {retries} retries: {last_err}") from last_err
 
 
+class _BlockingPool(psycopg2.pool.ThreadedConnectionPool):
+    # ThreadedConnectionPool raises PoolError once maxconn connections are checked out; ingest
+    # workers wait for a free connection instead.
+    def __init__(self, minconn: int, maxconn: int, *args: Any, **kwargs: Any) -> None:
+        self._slots = threading.BoundedSemaphore(maxconn)
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        # putconn only keeps a returned connection while fewer than minconn are idle and closes the
+        # rest. Only minconn are opened up front, but up to maxconn stay open once used, so
+        # concurrent workers keep their sessions and prepared statements between checkouts.
+        self.minconn = maxconn
+
+    def getconn(self, key: Any = None) -> _Connection:
+        self._slots.acquire()
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn: Any = None, key: Any = None, close: bool = False) -> None:
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+
+_pools: dict[str, _BlockingPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(dsn: str, maxconn: int = 4) -> _BlockingPool:
+    # One pool per DSN for the whole process, so subcommands that bootstrap and then query
+    # (ingest, qa) reuse the same server session instead of handshaking twice.
+    with _pools_lock:
+        pool = _pools.get(dsn)
+        if pool is None:
+            pool = _with_retries(
+                lambda: _BlockingPool(1, maxconn, dsn, connection_factory=_Connection, **_CONNECT_KWARGS),
+                retries=30,
+                sleep_seconds=1.0,
+            )
+            _pools[dsn] = pool
+        return pool
+
+
 @contextmanager
-def get_cursor(conn) -> Iterator[psycopg2.extensions.cursor]:
-    cur = conn.cursor()
+def pooled(dsn: str, *, autocommit: bool = False, maxconn: int = 4) -> Iterator[_Connection]:
+    pool = get_pool(dsn, maxconn=maxconn)
+    conn = pool.getconn()
     try:
-        yield cur
+        conn.autocommit = autocommit
+        yield conn
     finally:
-        cur.close()
+        # putconn rolls back anything left open and discards broken connections.
+        pool.putconn(conn)
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
+
+
+def _cursor(conn) -> psycopg2.extensions.cursor:
+    cur = getattr(conn, "_cdr_cursor", None)
+    if cur is None or cur.closed:
+        cur = conn.cursor()
+        conn._cdr_cursor = cur
+    return cur
 
 
 def execute(conn, sql: str, params: Sequence[Any] | None = None) -> None:
-    with get_cursor(conn) as cur:
-        cur.execute(sql, params)
+    _cursor(conn).execute(sql, params)
 
 
 def fetchall(conn, sql: str, params: Sequence[Any] | None = None) -> list[tuple]:
-    with get_cursor(conn) as cur:
+    cur = _cursor(conn)
+    cur.execute(sql, params)
+    return cur.fetchall()
+
+
+_iter_ids = itertools.count()
+
+
+def iter_rows(conn, sql: str, params: Sequence[Any] | None = None, itersize: int = 5000) -> Iterator[tuple]:
+    # Server-side (named) cursor: rows arrive itersize at a time instead of all at once.
+    # Named cursors only live inside a transaction, so conn must not be in autocommit mode.
+    with conn.cursor(name=f"cdr_iter_{next(_iter_ids)}") as cur:
+        cur.itersize = itersize
         cur.execute(sql, params)
-        return cur.fetchall()
+        yield from cur
+
+
+def prepare(conn, name: str, sql: str) -> None:
+    # `sql` uses $1..$n placeholders. Prepared statements live for the session (they survive
+    # rollbacks), so each name is only sent to the server once per connection.
+    prepared = getattr(conn, "_cdr_prepared", None)
+    if prepared is None:
+        prepared = conn._cdr_prepared = set()
+    if name in prepared:
+        return
+    execute(conn, f"PREPARE {name} AS {sql}")
+    prepared.add(name)
+
+
+def _execute_sql(name: str, n_params: int) -> str:
+    if not n_params:
+        return f"EXECUTE {name}"
+    return f"EXECUTE {name} ({', '.join(['%s'] * n_params)})"
+
+
+def fetchall_prepared(conn, name: str, params: Sequence[Any] = ()) -> list[tuple]:
+    return fetchall(conn, _execute_sql(name, len(params)), params)
+
+
+def execute_prepared_batch(conn, name: str, rows: Sequence[Sequence[Any]], page_size: int = 100) -> None:
+    # Runs the prepared statement once per row, in order, sending page_size EXECUTEs per round trip.
+    if rows:
+        execute_batch(conn, _execute_sql(name, len(rows[0])), rows, page_size=page_size)
+
+
+def execute_batch(conn, sql: str, rows: Iterable[Sequence[Any]], page_size: int = 1000) -> None:
+    psycopg2.extras.execute_batch(_cursor(conn), sql, rows, page_size=page_size)
 
 
-def execute_batch(conn, sql: str, rows: Iterable[Sequence[Any]]) -> None:
-    with get_cursor(conn) as cur:
-        psycopg2.extras.execute_batch(cur, sql, rows, page_size=500)
+def execute_values(
+    conn,
+    sql: str,
+    rows: Iterable[Sequence[Any]],
+    template: str | None = None,
+    page_size: int = 500,
+) -> None:
+    # `sql` carries a single `VALUES %s` placeholder; each page of rows is sent as one
+    # multi-row INSERT instead of one statement per row.
+    psycopg2.extras.execute_values(_cursor(conn), sql, rows, template=template, page_size=page_size)
 
 
 @contextmanager
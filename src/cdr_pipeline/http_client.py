@@ -17,7 +17,12 @@ class HttpRequestFailed(RuntimeError):
         super().__init__(f"HTTP request failed for {url}: {cause}")
 
 
-def build_session(retry_total: int, backoff_factor: float, user_agent: str) -> requests.Session:
+# urllib3 keeps one connection pool per host; retain enough host pools that a worker's session still
+# has warm keep-alive connections when a later brand is served from a host it has already visited.
+_HOST_POOLS = 100
+
+
+def build_session(retry_total: int, backoff_factor: float, user_agent: str, pool_maxsize: int = 20) -> requests.Session:
     session = requests.Session()
     retry = Retry(
         total=retry_total,
@@ -30,7 +35,7 @@ def build_session(retry_total: int, backoff_factor: float, user_agent: str) -> r
         raise_on_status=False,
         respect_retry_after_header=True,
     )
-    adapter = HTTPAdapter(max_retries=retry, pool_connections=20, pool_maxsize=20)
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=_HOST_POOLS, pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     session.headers.update({"Accept": "application/json", "User-Agent": user_agent})
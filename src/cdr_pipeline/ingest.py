@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import functools
+import gzip
 import hashlib
-import json
 import logging
 import os
+import re
+import string
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import closing
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
+import orjson
 from dotenv import load_dotenv
 
 from cdr_pipeline.bootstrap import bootstrap_db
 from cdr_pipeline.config import Config
-from cdr_pipeline.db import connect_with_retries, execute, execute_batch, transaction
-from cdr_pipeline.drift import record_and_detect_drift
+from cdr_pipeline.db import execute, execute_values, fetchall, fetchall_prepared, pooled, prepare, transaction
+from cdr_pipeline.drift import fingerprint_row, record_fingerprints
 from cdr_pipeline.http_client import HttpRequestFailed, build_session, get_with_version_fallback
 
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
@@ -23,31 +30,106 @@ logger = logging.getLogger(__name__)
 
 
 def _sha256_bytes(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
+    # Payload hashes are change-detection fingerprints, not a security control.
+    return hashlib.sha256(b, usedforsecurity=False).hexdigest()
 
 
+def _snippet(resp, limit: int = 500) -> str:
+    # Decode only the head of the body for error messages; resp.text would decode all of it.
+    body = resp.content
+    return body[:limit].decode("utf-8", "replace") if body else f"HTTP {resp.status_code}"
+
+
+_SAFE_ASCII = frozenset(string.ascii_letters + string.digits + "-_.")
+_SAFE_FILENAME_TABLE = {c: "_" for c in range(128) if chr(c) not in _SAFE_ASCII}
+# \w matches exactly str.isalnum() characters plus "_", so non-ASCII ids keep the same characters as before.
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.-]")
+
+
+@functools.lru_cache(maxsize=4096)
 def _safe_filename(s: str) -> str:
-    return "".join(ch if ch.isalnum() or ch in ("-", "_", ".") else "_" for ch in s)
+    if s.isascii():
+        return s.translate(_SAFE_FILENAME_TABLE)
+    return _UNSAFE_FILENAME_CHARS.sub("_", s)
 
 
-def _write_bronze_json(run_date: str, provider_id: str, endpoint: str, page_num: int, payload_bytes: bytes) -> str:
-    out_dir = os.path.join(
+@functools.lru_cache(maxsize=4096)
+def _bronze_dir(run_date: str, provider_id: str, endpoint: str) -> str:
+    return os.path.join(
         "data",
         "bronze",
         f"ingestion_date={run_date}",
         f"provider={_safe_filename(provider_id)}",
         f"endpoint={_safe_filename(endpoint)}",
     )
-    os.makedirs(out_dir, exist_ok=True)
-    path = os.path.join(out_dir, f"page={page_num:04d}.json")
-    with open(path, "wb") as f:
+
+
+# Bronze directories already created by this process, so later pages skip the makedirs syscalls.
+_created_dirs: set[str] = set()
+_created_dirs_lock = threading.Lock()
+
+
+def _write_bronze_json(run_date: str, provider_id: str, endpoint: str, page_num: int, payload_bytes: bytes) -> str:
+    out_dir = _bronze_dir(run_date, provider_id, endpoint)
+    if out_dir not in _created_dirs:
+        with _created_dirs_lock:
+            os.makedirs(out_dir, exist_ok=True)
+            _created_dirs.add(out_dir)
+    path = os.path.join(out_dir, f"page={page_num:04d}.json.gz")
+    # Fastest gzip level: CDR payloads are repetitive JSON and still shrink several-fold. mtime=0
+    # keeps re-runs of the same payload byte-identical.
+    with open(path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=1, mtime=0) as f:
         f.write(payload_bytes)
     return path
 
 
+# Fast paths for the usual CDR link shapes (absolute http(s) links, host-relative paths, plain
+# relative paths under a base URL). Anything urljoin would rewrite goes through urljoin instead.
+_HTTP_ORIGIN = re.compile(r"https?://[A-Za-z0-9.\-_~%!$&'()*+,;=:@]+(?=[/?#]|\Z)")
+
+
+def _needs_urljoin(part: str) -> bool:
+    # urlsplit strips leading control characters/spaces and tabs/newlines; urljoin drops empty
+    # queries/fragments/;params, collapses empty segments and resolves dot segments.
+    return (
+        part[:1] <= " "
+        or "//" in part
+        or "/." in part
+        or part.endswith(("?", "#"))
+        or "?#" in part
+        or ";" in part
+        or "\t" in part
+        or "\r" in part
+        or "\n" in part
+    )
+
+
+def _join_base(base: str, path: str) -> str:
+    # `base` ends with "/" and `path` has no leading "/": same result as urljoin(base, path).
+    origin = _HTTP_ORIGIN.match(base)
+    if (
+        origin is None
+        or _needs_urljoin(base[origin.end() :])
+        or "?" in base
+        or "#" in base
+        or _needs_urljoin(path)
+        or path.startswith(".")
+        or ":" in path.split("/", 1)[0]
+    ):
+        return urljoin(base, path)
+    return base + path
+
+
 def _resolve_next_url(current_url: str, next_url: str) -> str:
     if not next_url:
         return ""
+    if _HTTP_ORIGIN.match(next_url):
+        # Returned as-is, exactly like the urlparse check below.
+        return next_url
+    if next_url.startswith("/") and not _needs_urljoin(next_url):
+        origin = _HTTP_ORIGIN.match(current_url)
+        if origin:
+            return origin.group() + next_url
     parsed = urlparse(next_url)
     if parsed.scheme and parsed.netloc:
         return next_url
@@ -72,7 +154,7 @@ def _insert_brand(conn, run_id: str, brand: dict, extracted_at: datetime) -> Non
             brand.get("dataHolderBrandId"),
             brand.get("brandName"),
             brand.get("brandGroup"),
-            json.dumps(brand.get("industries", [])),
+            orjson.dumps(brand.get("industries", [])).decode(),
             brand.get("publicBaseUri"),
             brand.get("productBaseUri"),
             brand.get("logoUri"),
@@ -82,8 +164,81 @@ def _insert_brand(conn, run_id: str, brand: dict, extracted_at: datetime) -> Non
     )
 
 
+@dataclass
+class _RowBuffer:
+    # Rows collected while fetching, keyed by primary key so a later write for the same key
+    # replaces the earlier one exactly like the per-row upserts did. Flushed as multi-row INSERTs.
+    api_calls: dict[tuple, tuple] = field(default_factory=dict)
+    products_raw: dict[tuple, tuple] = field(default_factory=dict)
+    product_detail_raw: dict[tuple, tuple] = field(default_factory=dict)
+    # Schema fingerprints (drift.fingerprint_row), recorded after the raw rows.
+    fingerprints: list[tuple] = field(default_factory=list)
+
+
+_API_CALL_LOG_SQL = """
+INSERT INTO bronze.api_call_log (
+    run_id, provider_id, endpoint, url, http_status, responded_xv, fetched_at, etag, payload_hash, error
+) VALUES %s
+ON CONFLICT (run_id, provider_id, endpoint, url) DO UPDATE SET
+    http_status = EXCLUDED.http_status,
+    responded_xv = EXCLUDED.responded_xv,
+    fetched_at = EXCLUDED.fetched_at,
+    etag = EXCLUDED.etag,
+    payload_hash = EXCLUDED.payload_hash,
+    error = EXCLUDED.error
+"""
+
+_PRODUCTS_RAW_SQL = """
+INSERT INTO raw.products_raw (
+    run_id, provider_id, brand_name, endpoint, url, page_num, http_status, responded_xv, fetched_at, etag, payload, payload_hash
+) VALUES %s
+ON CONFLICT (run_id, provider_id, endpoint, page_num) DO UPDATE SET
+    http_status = EXCLUDED.http_status,
+    responded_xv = EXCLUDED.responded_xv,
+    fetched_at = EXCLUDED.fetched_at,
+    etag = EXCLUDED.etag,
+    payload = EXCLUDED.payload,
+    payload_hash = EXCLUDED.payload_hash
+"""
+_PRODUCTS_RAW_TEMPLATE = "(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s)"
+
+_PRODUCT_DETAIL_RAW_SQL = """
+INSERT INTO raw.product_detail_raw (
+    run_id, provider_id, brand_name, product_id, url, http_status, responded_xv, fetched_at, etag, payload, payload_hash
+) VALUES %s
+ON CONFLICT (run_id, provider_id, product_id) DO UPDATE SET
+    http_status = EXCLUDED.http_status,
+    responded_xv = EXCLUDED.responded_xv,
+    fetched_at = EXCLUDED.fetched_at,
+    etag = EXCLUDED.etag,
+    payload = EXCLUDED.payload,
+    payload_hash = EXCLUDED.payload_hash
+"""
+_PRODUCT_DETAIL_RAW_TEMPLATE = "(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s)"
+
+
+def _flush_rows(conn, buf: _RowBuffer) -> None:
+    # raw payloads are large jsonb documents, so they go out in smaller pages than the log rows.
+    if buf.api_calls:
+        execute_values(conn, _API_CALL_LOG_SQL, list(buf.api_calls.values()))
+        buf.api_calls.clear()
+    if buf.products_raw:
+        execute_values(
+            conn, _PRODUCTS_RAW_SQL, list(buf.products_raw.values()), template=_PRODUCTS_RAW_TEMPLATE, page_size=200
+        )
+        buf.products_raw.clear()
+    if buf.product_detail_raw:
+        execute_values(
+            conn, _PRODUCT_DETAIL_RAW_SQL, list(buf.product_detail_raw.values()), template=_PRODUCT_DETAIL_RAW_TEMPLATE, page_size=200
+        )
+        buf.product_detail_raw.clear()
+    if buf.fingerprints:
+        record_fingerprints(conn, buf.fingerprints)
+        buf.fingerprints.clear()
+
+
 def _log_api_call(
-    conn,
+    buf: _RowBuffer,
     run_id: str,
     provider_id: str,
     endpoint: str,
@@ -95,26 +250,22 @@ def _log_api_call(
     payload_hash: str | None,
     error: str | None,
 ) -> None:
-    execute(
-        conn,
-        """
-        INSERT INTO bronze.api_call_log (
-            run_id, provider_id, endpoint, url, http_status, responded_xv, fetched_at, etag, payload_hash, error
-        ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        ON CONFLICT (run_id, provider_id, endpoint, url) DO UPDATE SET
-            http_status = EXCLUDED.http_status,
-            responded_xv = EXCLUDED.responded_xv,
-            fetched_at = EXCLUDED.fetched_at,
-            etag = EXCLUDED.etag,
-            payload_hash = EXCLUDED.payload_hash,
-            error = EXCLUDED.error
-        """,
-        (run_id, provider_id, endpoint, url, status, responded_xv, fetched_at, etag, payload_hash, error),
+    buf.api_calls[(run_id, provider_id, endpoint, url)] = (
+        run_id,
+        provider_id,
+        endpoint,
+        url,
+        status,
+        responded_xv,
+        fetched_at,
+        etag,
+        payload_hash,
+        error,
     )
 
 
 def _insert_products_raw(
-    conn,
+    buf: _RowBuffer,
     run_id: str,
     provider_id: str,
     brand_name: str | None,
@@ -128,39 +279,24 @@ def _insert_products_raw(
     payload: Any | None,
     payload_hash: str | None,
 ) -> None:
-    execute(
-        conn,
-        """
-        INSERT INTO raw.products_raw (
-            run_id, provider_id, brand_name, endpoint, url, page_num, http_status, responded_xv, fetched_at, etag, payload, payload_hash
-        ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s)
-        ON CONFLICT (run_id, provider_id, endpoint, page_num) DO UPDATE SET
-            http_status = EXCLUDED.http_status,
-            responded_xv = EXCLUDED.responded_xv,
-            fetched_at = EXCLUDED.fetched_at,
-            etag = EXCLUDED.etag,
-            payload = EXCLUDED.payload,
-            payload_hash = EXCLUDED.payload_hash
-        """,
-        (
-            run_id,
-            provider_id,
-            brand_name,
-            endpoint,
-            url,
-            page_num,
-            status,
-            responded_xv,
-            fetched_at,
-            etag,
-            json.dumps(payload) if payload is not None else None,
-            payload_hash,
-        ),
+    buf.products_raw[(run_id, provider_id, endpoint, page_num)] = (
+        run_id,
+        provider_id,
+        brand_name,
+        endpoint,
+        url,
+        page_num,
+        status,
+        responded_xv,
+        fetched_at,
+        etag,
+        orjson.dumps(payload).decode() if payload is not None else None,
+        payload_hash,
     )
 
 
 def _insert_product_detail_raw(
-    conn,
+    buf: _RowBuffer,
     run_id: str,
     provider_id: str,
     brand_name: str | None,
@@ -173,39 +309,96 @@ def _insert_product_detail_raw(
     payload: Any | None,
     payload_hash: str | None,
 ) -> None:
-    execute(
-        conn,
-        """
-        INSERT INTO raw.product_detail_raw (
-            run_id, provider_id, brand_name, product_id, url, http_status, responded_xv, fetched_at, etag, payload, payload_hash
-        ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s)
-        ON CONFLICT (run_id, provider_id, product_id) DO UPDATE SET
-            http_status = EXCLUDED.http_status,
-            responded_xv = EXCLUDED.responded_xv,
-            fetched_at = EXCLUDED.fetched_at,
-            etag = EXCLUDED.etag,
-            payload = EXCLUDED.payload,
-            payload_hash = EXCLUDED.payload_hash
-        """,
-        (
-            run_id,
-            provider_id,
-            brand_name,
-            product_id,
-            url,
-            status,
-            responded_xv,
-            fetched_at,
-            etag,
-            json.dumps(payload) if payload is not None else None,
-            payload_hash,
-        ),
+    buf.product_detail_raw[(run_id, provider_id, product_id)] = (
+        run_id,
+        provider_id,
+        brand_name,
+        product_id,
+        url,
+        status,
+        responded_xv,
+        fetched_at,
+        etag,
+        orjson.dumps(payload).decode() if payload is not None else None,
+        payload_hash,
     )
 
 
+# Conditional GETs: the latest stored payload per URL (or product) and its ETag. A 304 copies that
+# stored row into the current run server-side instead of re-downloading, re-parsing and re-inserting it;
+# the copy statements run once per unchanged page/detail, so they are prepared per connection.
+_KNOWN_PAGE_ETAGS_SQL = """
+SELECT DISTINCT ON (url) url, etag
+FROM raw.products_raw
+WHERE provider_id = %s AND endpoint = %s AND payload IS NOT NULL AND fetched_at > now() - %s * interval '1 hour'
+ORDER BY url, fetched_at DESC
+"""
+
+_KNOWN_DETAIL_ETAGS_SQL = """
+SELECT DISTINCT ON (product_id) product_id, etag
+FROM raw.product_detail_raw
+WHERE provider_id = %s AND payload IS NOT NULL AND fetched_at > now() - %s * interval '1 hour'
+ORDER BY product_id, fetched_at DESC
+"""
+
+_REUSE_PRODUCTS_RAW_SQL = """
+INSERT INTO raw.products_raw (
+    run_id, provider_id, brand_name, endpoint, url, page_num, http_status, responded_xv, fetched_at, etag, payload, payload_hash
+)
+SELECT $1, provider_id, $2, endpoint, url, $3, 304, $4, $5, etag, payload, payload_hash
+FROM raw.products_raw
+WHERE provider_id = $6 AND endpoint = $7 AND url = $8 AND etag = $9 AND payload IS NOT NULL
+ORDER BY fetched_at DESC
+LIMIT 1
+ON CONFLICT (run_id, provider_id, endpoint, page_num) DO UPDATE SET
+    http_status = EXCLUDED.http_status,
+    responded_xv = EXCLUDED.responded_xv,
+    fetched_at = EXCLUDED.fetched_at,
+    etag = EXCLUDED.etag,
+    payload = EXCLUDED.payload,
+    payload_hash = EXCLUDED.payload_hash
+RETURNING
+    payload_hash,
+    payload->'links'->>'next',
+    jsonb_path_query_first(payload, '$.data.products.size()'),
+    jsonb_path_query_array(payload, '$.data.products[*].productId')
+"""
+
+_REUSE_PRODUCT_DETAIL_RAW_SQL = """
+INSERT INTO raw.product_detail_raw (
+    run_id, provider_id, brand_name, product_id, url, http_status, responded_xv, fetched_at, etag, payload, payload_hash
+)
+SELECT $1, provider_id, $2, product_id, $3, 304, $4, $5, etag, payload, payload_hash
+FROM raw.product_detail_raw
+WHERE provider_id = $6 AND product_id = $7 AND etag = $8 AND payload IS NOT NULL
+ORDER BY fetched_at DESC
+LIMIT 1
+ON CONFLICT (run_id, provider_id, product_id) DO UPDATE SET
+    http_status = EXCLUDED.http_status,
+    responded_xv = EXCLUDED.responded_xv,
+    fetched_at = EXCLUDED.fetched_at,
+    etag = EXCLUDED.etag,
+    payload = EXCLUDED.payload,
+    payload_hash = EXCLUDED.payload_hash
+RETURNING payload_hash
+"""
+
+
+def _known_etags(cfg: Config, conn, sql: str, params: tuple) -> dict[str, str]:
+    # Only ETags seen within ETAG_MAX_AGE_HOURS are revalidated; 0 turns conditional GETs off.
+    if cfg.etag_max_age_hours <= 0:
+        return {}
+    return {key: etag for key, etag in fetchall(conn, sql, (*params, cfg.etag_max_age_hours)) if etag}
+
+
+def _conditional_headers(etag: str | None) -> dict[str, str] | None:
+    return {"If-None-Match": etag} if etag else None
+
+
 def _discover_brands(cfg: Config, session, conn, run_id: str, run_date: str) -> list[dict]:
     url = f"{cfg.register_base}/cdr-register/v1/{cfg.register_industry}/data-holders/brands/summary"
     endpoint = "cdr-register:brands-summary"
+    buf = _RowBuffer()
 
     try:
         resp, responded_xv = get_with_version_fallback(
@@ -218,7 +411,7 @@ def _discover_brands(cfg: Config, session, conn, run_id: str, run_date: str) ->
     except HttpRequestFailed as e:
         fetched_at = datetime.now(timezone.utc)
         _log_api_call(
-            conn,
+            buf,
             run_id,
             "cdr-register",
             endpoint,
@@ -230,13 +423,14 @@ def _discover_brands(cfg: Config, session, conn, run_id: str, run_date: str) ->
             None,
             str(e),
         )
+        _flush_rows(conn, buf)
         raise
 
     payload_bytes = resp.content or b""
     fetched_at = datetime.now(timezone.utc)
     payload_hash = _sha256_bytes(payload_bytes) if payload_bytes else None
     _log_api_call(
-        conn,
+        buf,
         run_id,
         "cdr-register",
         endpoint,
@@ -246,14 +440,15 @@ def _discover_brands(cfg: Config, session, conn, run_id: str, run_date: str) ->
         fetched_at,
         resp.headers.get("etag"),
         payload_hash,
-        None if resp.status_code == 200 else (resp.text[:500] if resp.text else f"HTTP {resp.status_code}"),
+        None if resp.status_code == 200 else _snippet(resp),
     )
+    _flush_rows(conn, buf)
     _write_bronze_json(run_date, "cdr-register", endpoint, 1, payload_bytes)
 
     if resp.status_code != 200:
-        raise RuntimeError(f"Register discovery failed: HTTP {resp.status_code} {resp.text[:300]}")
+        raise RuntimeError(f"Register discovery failed: HTTP {resp.status_code} {_snippet(resp, 300)}")
 
-    data = (resp.json() or {}).get("data", [])
+    data = (orjson.loads(payload_bytes) or {}).get("data", [])
     filt = cfg.filter_industry.lower().strip()
 
     out = []
@@ -274,18 +469,20 @@ def _fetch_products_for_brand(cfg: Config, session, conn, run_id: str, run_date:
         logger.warning("Skipping brand with missing provider_id/base_uri: %s", brand)
         return 0, set()
 
-    products_url = urljoin(base_uri.rstrip("/") + "/", cfg.products_path.lstrip("/"))
+    products_url = _join_base(base_uri.rstrip("/") + "/", cfg.products_path.lstrip("/"))
     next_url = products_url
     seen_urls: set[str] = set()
     page_num = 1
     total_products = 0
     product_ids: set[str] = set()
+    buf = _RowBuffer()
+    etags = _known_etags(cfg, conn, _KNOWN_PAGE_ETAGS_SQL, (provider_id, endpoint))
 
     while next_url:
         if page_num > cfg.max_pages_per_provider:
             logger.error("Stopping pagination for provider %s after %s pages (MAX_PAGES_PER_PROVIDER).", provider_id, cfg.max_pages_per_provider)
             _log_api_call(
-                conn,
+                buf,
                 run_id,
                 provider_id,
                 endpoint,
@@ -302,7 +499,7 @@ def _fetch_products_for_brand(cfg: Config, session, conn, run_id: str, run_date:
         if next_url in seen_urls:
             logger.error("Detected pagination loop for provider %s at URL %s. Stopping.", provider_id, next_url)
             _log_api_call(
-                conn,
+                buf,
                 run_id,
                 provider_id,
                 endpoint,
@@ -318,6 +515,7 @@ def _fetch_products_for_brand(cfg: Config, session, conn, run_id: str, run_date:
         seen_urls.add(next_url)
 
         fetched_at = datetime.now(timezone.utc)
+        known_etag = etags.get(next_url)
         try:
             resp, responded_xv = get_with_version_fallback(
                 session=session,
@@ -325,10 +523,29 @@ def _fetch_products_for_brand(cfg: Config, session, conn, run_id: str, run_date:
                 timeout_seconds=cfg.timeout_seconds,
                 preferred_xv=cfg.products_xv,
                 fallback_versions=cfg.products_xv_fallback,
+                extra_headers=_conditional_headers(known_etag),
             )
+            reused = None
+            if resp.status_code == 304 and known_etag:
+                prepare(conn, "cdr_reuse_products_raw", _REUSE_PRODUCTS_RAW_SQL)
+                rows = fetchall_prepared(
+                    conn,
+                    "cdr_reuse_products_raw",
+                    (run_id, brand_name, page_num, responded_xv, fetched_at, provider_id, endpoint, next_url, known_etag),
+                )
+                reused = rows[0] if rows else None
+                if reused is None:
+                    # The stored copy is gone; fetch the full page instead.
+                    resp, responded_xv = get_with_version_fallback(
+                        session=session,
+                        url=next_url,
+                        timeout_seconds=cfg.timeout_seconds,
+                        preferred_xv=cfg.products_xv,
+                        fallback_versions=cfg.products_xv_fallback,
+                    )
         except HttpRequestFailed as e:
             _log_api_call(
-                conn,
+                buf,
                 run_id,
                 provider_id,
                 endpoint,
@@ -341,13 +558,23 @@ def _fetch_products_for_brand(cfg: Config, session, conn, run_id: str, run_date:
                 str(e),
             )
             break
+
+        if reused is not None:
+            payload_hash, nxt, n_products, pids = reused
+            _log_api_call(buf, run_id, provider_id, endpoint, next_url, 304, responded_xv, fetched_at, known_etag, payload_hash, None)
+            total_products += n_products or 0
+            product_ids.update(str(pid) for pid in pids or () if pid)
+            next_url = _resolve_next_url(next_url, nxt or "")
+            page_num += 1
+            continue
+
         etag = resp.headers.get("etag")
         status = resp.status_code
         payload_bytes = resp.content or b""
         payload_hash = _sha256_bytes(payload_bytes) if payload_bytes else None
 
         _log_api_call(
-            conn,
+            buf,
             run_id,
             provider_id,
             endpoint,
@@ -357,7 +584,7 @@ def _fetch_products_for_brand(cfg: Config, session, conn, run_id: str, run_date:
             fetched_at,
             etag,
             payload_hash,
-            None if status == 200 else (resp.text[:500] if resp.text else f"HTTP {status}"),
+            None if status == 200 else _snippet(resp),
         )
 
         _write_bronze_json(run_date, provider_id, endpoint, page_num, payload_bytes)
@@ -365,15 +592,15 @@ def _fetch_products_for_brand(cfg: Config, session, conn, run_id: str, run_date:
         payload_obj = None
         if status == 200 and payload_bytes:
             try:
-                payload_obj = resp.json()
+                payload_obj = orjson.loads(payload_bytes)
             except Exception as e:  # noqa: BLE001
                 payload_obj = None
-                _log_api_call(conn, run_id, provider_id, endpoint, next_url, status, responded_xv, fetched_at, etag, payload_hash, f"JSON parse error: {e}")
+                _log_api_call(buf, run_id, provider_id, endpoint, next_url, status, responded_xv, fetched_at, etag, payload_hash, f"JSON parse error: {e}")
 
-        _insert_products_raw(conn, run_id, provider_id, brand_name, endpoint, next_url, page_num, status, responded_xv, fetched_at, etag, payload_obj, payload_hash)
+        _insert_products_raw(buf, run_id, provider_id, brand_name, endpoint, next_url, page_num, status, responded_xv, fetched_at, etag, payload_obj, payload_hash)
 
         if payload_obj is not None:
-            record_and_detect_drift(conn, provider_id, endpoint, payload_obj, fetched_at, run_id)
+            buf.fingerprints.append(fingerprint_row(provider_id, endpoint, payload_obj, fetched_at, run_id, payload_hash))
             products = (((payload_obj.get("data") or {}).get("products")) or [])
             total_products += len(products)
             for p in products:
@@ -388,9 +615,26 @@ def _fetch_products_for_brand(cfg: Config, session, conn, run_id: str, run_date:
         else:
             break
 
+    _flush_rows(conn, buf)
     return total_products, product_ids
 
 
+def _get_product_detail(cfg: Config, session, url: str, etag: str | None = None):
+    fetched_at = datetime.now(timezone.utc)
+    try:
+        resp, responded_xv = get_with_version_fallback(
+            session=session,
+            url=url,
+            timeout_seconds=cfg.timeout_seconds,
+            preferred_xv=cfg.product_detail_xv,
+            fallback_versions=cfg.product_detail_xv_fallback,
+            extra_headers=_conditional_headers(etag),
+        )
+    except HttpRequestFailed as e:
+        return fetched_at, None, None, e
+    return fetched_at, resp, responded_xv, None
+
+
 def _fetch_product_details(cfg: Config, session, conn, run_id: str, run_date: str, brand: dict, product_ids: set[str]) -> int:
     provider_id = brand.get("dataHolderBrandId")
     brand_name = brand.get("brandName")
@@ -400,90 +644,159 @@ def _fetch_product_details(cfg: Config, session, conn, run_id: str, run_date: st
     if not provider_id or not base_uri or not product_ids:
         return 0
 
+    base = base_uri.rstrip("/") + "/"
+    path_template = cfg.product_detail_path.lstrip("/")
+    # Detail GETs all hit the same data holder, so they share the brand's session (and its
+    # keep-alive connections) across a small pool. Each response is processed on this thread as it
+    # arrives, while the remaining requests are still in flight.
+    etags = _known_etags(cfg, conn, _KNOWN_DETAIL_ETAGS_SQL, (provider_id,))
     ok = 0
-    for i, pid in enumerate(sorted(product_ids), start=1):
-        url = urljoin(base_uri.rstrip("/") + "/", cfg.product_detail_path.lstrip("/").format(productId=pid))
-        fetched_at = datetime.now(timezone.utc)
-        try:
-            resp, responded_xv = get_with_version_fallback(
-                session=session,
-                url=url,
-                timeout_seconds=cfg.timeout_seconds,
-                preferred_xv=cfg.product_detail_xv,
-                fallback_versions=cfg.product_detail_xv_fallback,
-            )
-        except HttpRequestFailed as e:
+    buf = _RowBuffer()
+    with ThreadPoolExecutor(max_workers=max(1, cfg.product_detail_concurrency), thread_name_prefix="detail") as ex:
+        futures = {}
+        for pid in product_ids:
+            url = _join_base(base, path_template.format(productId=pid))
+            futures[ex.submit(_get_product_detail, cfg, session, url, etags.get(pid))] = (pid, url)
+
+        for i, fut in enumerate(as_completed(futures), start=1):
+            # Counted before any early exit, so 304s and errors advance the progress log too.
+            if i % 50 == 0:
+                logger.info("  detail progress: %s/%s", i, len(futures))
+            pid, url = futures[fut]
+            fetched_at, resp, responded_xv, err = fut.result()
+            if err is None and resp.status_code == 304 and etags.get(pid):
+                prepare(conn, "cdr_reuse_product_detail_raw", _REUSE_PRODUCT_DETAIL_RAW_SQL)
+                rows = fetchall_prepared(
+                    conn,
+                    "cdr_reuse_product_detail_raw",
+                    (run_id, brand_name, url, responded_xv, fetched_at, provider_id, pid, etags[pid]),
+                )
+                if rows:
+                    _log_api_call(buf, run_id, provider_id, endpoint, url, 304, responded_xv, fetched_at, etags[pid], rows[0][0], None)
+                    ok += 1
+                    continue
+                fetched_at, resp, responded_xv, err = _get_product_detail(cfg, session, url)
+            if err is not None:
+                _log_api_call(
+                    buf,
+                    run_id,
+                    provider_id,
+                    endpoint,
+                    url,
+                    0,
+                    None,
+                    fetched_at,
+                    None,
+                    None,
+                    str(err),
+                )
+                continue
+            etag = resp.headers.get("etag")
+            status = resp.status_code
+            payload_bytes = resp.content or b""
+            payload_hash = _sha256_bytes(payload_bytes) if payload_bytes else None
+
             _log_api_call(
-                conn,
+                buf,
                 run_id,
                 provider_id,
                 endpoint,
                 url,
-                0,
-                None,
+                status,
+                responded_xv,
                 fetched_at,
-                None,
-                None,
-                str(e),
+                etag,
+                payload_hash,
+                None if status == 200 else _snippet(resp),
             )
-            continue
-        etag = resp.headers.get("etag")
-        status = resp.status_code
-        payload_bytes = resp.content or b""
-        payload_hash = _sha256_bytes(payload_bytes) if payload_bytes else None
-
-        _log_api_call(
-            conn,
-            run_id,
-            provider_id,
-            endpoint,
-            url,
-            status,
-            responded_xv,
-            fetched_at,
-            etag,
-            payload_hash,
-            None if status == 200 else (resp.text[:500] if resp.text else f"HTTP {status}"),
-        )
-
-        payload_obj = None
-        if status == 200 and payload_bytes:
-            try:
-                payload_obj = resp.json()
-            except Exception as e:  # noqa: BLE001
-                payload_obj = None
-                _log_api_call(conn, run_id, provider_id, endpoint, url, status, responded_xv, fetched_at, etag, payload_hash, f"JSON parse error: {e}")
 
-        _insert_product_detail_raw(conn, run_id, provider_id, brand_name, pid, url, status, responded_xv, fetched_at, etag, payload_obj, payload_hash)
+            payload_obj = None
+            if status == 200 and payload_bytes:
+                try:
+                    payload_obj = orjson.loads(payload_bytes)
+                except Exception as e:  # noqa: BLE001
+                    payload_obj = None
+                    _log_api_call(buf, run_id, provider_id, endpoint, url, status, responded_xv, fetched_at, etag, payload_hash, f"JSON parse error: {e}")
 
-        if payload_obj is not None:
-            record_and_detect_drift(conn, provider_id, endpoint, payload_obj, fetched_at, run_id)
+            _insert_product_detail_raw(buf, run_id, provider_id, brand_name, pid, url, status, responded_xv, fetched_at, etag, payload_obj, payload_hash)
 
-        if status == 200:
-            ok += 1
+            if payload_obj is not None:
+                buf.fingerprints.append(fingerprint_row(provider_id, endpoint, payload_obj, fetched_at, run_id, payload_hash))
 
-        if i % 50 == 0:
-            logger.info("  detail progress: %s/%s", i, len(product_ids))
+            if status == 200:
+                ok += 1
 
     # also persist raw details as bronze files (optional; one file per product might be large)
     # (kept in db only by default)
 
+    _flush_rows(conn, buf)
     return ok
 
 
+class _ThreadSessions:
+    # Each ingest worker lazily builds its own requests.Session, so brands never share cookies or
+    # contend for one adapter's connection pool.
+    def __init__(self, cfg: Config) -> None:
+        self._cfg = cfg
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: list = []
+
+    def get(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            # Detail fetches share this session, so each host pool must hold that many connections.
+            session = build_session(
+                self._cfg.retry_total,
+                self._cfg.retry_backoff,
+                self._cfg.user_agent,
+                pool_maxsize=max(20, self._cfg.product_detail_concurrency),
+            )
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+
+def _process_brand(
+    cfg: Config, sessions: _ThreadSessions, run_id: str, run_date: str, b: dict, idx: int, total: int
+) -> tuple[int, int]:
+    pid = b.get("dataHolderBrandId")
+    name = b.get("brandName")
+    logger.info("[%s/%s] Fetching products for %s (%s)...", idx, total, name, pid)
+    session = sessions.get()
+    try:
+        with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn, transaction(conn):
+            n, product_ids = _fetch_products_for_brand(cfg, session, conn, run_id, run_date, b)
+            logger.info("  -> %s: %s products ingested (sum of pages).", pid, n)
+            ok = 0
+            if cfg.fetch_product_details:
+                ok = _fetch_product_details(cfg, session, conn, run_id, run_date, b, product_ids)
+                logger.info("  -> %s: %s product details ingested.", pid, ok)
+    except Exception as e:  # noqa: BLE001
+        logger.exception("Failed brand %s (%s): %s", name, pid, e)
+        return 0, 0
+    return n, ok
+
+
 def run_ingest(run_dt: datetime, provider_limit: int | None = None) -> None:
     load_dotenv(override=False)
     cfg = Config.from_env()
 
     bootstrap_db(force=False)
-    with closing(connect_with_retries(cfg.pg_dsn(), autocommit=False)) as conn, closing(
-        build_session(cfg.retry_total, cfg.retry_backoff, cfg.user_agent)
-    ) as session:
-        run_id = str(uuid.uuid4())
-        run_date = run_dt.strftime("%Y-%m-%d")
-        started_at = datetime.now(timezone.utc)
-
-        with transaction(conn):
+    run_id = str(uuid.uuid4())
+    run_date = run_dt.strftime("%Y-%m-%d")
+    started_at = datetime.now(timezone.utc)
+
+    with closing(_ThreadSessions(cfg)) as sessions:
+        # The run row is a single statement; autocommit keeps it from holding a transaction open.
+        with pooled(cfg.pg_dsn(), autocommit=True, maxconn=cfg.pg_pool_max) as conn:
             execute(
                 conn,
                 """
@@ -493,69 +806,63 @@ def run_ingest(run_dt: datetime, provider_limit: int | None = None) -> None:
                 (run_id, started_at, run_date, cfg.register_industry, cfg.filter_industry, cfg.fetch_product_details, None),
             )
 
-        # Discovery is isolated so its API-call diagnostics remain committed even if it fails.
-        with transaction(conn):
-            brands = _discover_brands(cfg, session, conn, run_id, run_date)
-            logger.info("Discovered %s brands (filtered to industry=%s).", len(brands), cfg.filter_industry)
-
-            valid_brands = [b for b in brands if b.get("dataHolderBrandId")]
-            skipped_missing_id = len(brands) - len(valid_brands)
-            if skipped_missing_id:
-                logger.warning("Skipping %s discovered brands missing dataHolderBrandId.", skipped_missing_id)
-
-            extracted_at = datetime.now(timezone.utc)
-            brand_rows = [
-                (
-                    run_id,
-                    b.get("dataHolderBrandId"),
-                    b.get("brandName"),
-                    b.get("brandGroup"),
-                    json.dumps(b.get("industries", [])),
-                    b.get("publicBaseUri"),
-                    b.get("productBaseUri"),
-                    b.get("logoUri"),
-                    b.get("lastUpdated"),
-                    extracted_at,
-                )
-                for b in valid_brands
-            ]
-            if brand_rows:
-                execute_batch(
-                    conn,
-                    """
-                    INSERT INTO bronze.data_holder_brand (
-                        run_id, data_holder_brand_id, brand_name, brand_group, industries,
-                        public_base_uri, product_base_uri, logo_uri, last_updated, extracted_at
-                    ) VALUES (
-                        %s, %s, %s, %s, %s::jsonb,
-                        %s, %s, %s, %s, %s
+        with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn:
+            # Discovery is isolated so its API-call diagnostics remain committed even if it fails.
+            with transaction(conn):
+                brands = _discover_brands(cfg, sessions.get(), conn, run_id, run_date)
+                logger.info("Discovered %s brands (filtered to industry=%s).", len(brands), cfg.filter_industry)
+
+                valid_brands = [b for b in brands if b.get("dataHolderBrandId")]
+                skipped_missing_id = len(brands) - len(valid_brands)
+                if skipped_missing_id:
+                    logger.warning("Skipping %s discovered brands missing dataHolderBrandId.", skipped_missing_id)
+
+                extracted_at = datetime.now(timezone.utc)
+                brand_rows = [
+                    (
+                        run_id,
+                        b.get("dataHolderBrandId"),
+                        b.get("brandName"),
+                        b.get("brandGroup"),
+                        orjson.dumps(b.get("industries", [])).decode(),
+                        b.get("publicBaseUri"),
+                        b.get("productBaseUri"),
+                        b.get("logoUri"),
+                        b.get("lastUpdated"),
+                        extracted_at,
                     )
-                    ON CONFLICT (run_id, data_holder_brand_id) DO NOTHING
-                    """,
-                    brand_rows,
-                )
-            brands = valid_brands
+                    for b in valid_brands
+                ]
+                if brand_rows:
+                    execute_values(
+                        conn,
+                        """
+                        INSERT INTO bronze.data_holder_brand (
+                            run_id, data_holder_brand_id, brand_name, brand_group, industries,
+                            public_base_uri, product_base_uri, logo_uri, last_updated, extracted_at
+                        ) VALUES %s
+                        ON CONFLICT (run_id, data_holder_brand_id) DO NOTHING
+                        """,
+                        brand_rows,
+                        template="(%s, %s, %s, %s, %s::jsonb, %s, %s, %s, %s, %s)",
+                    )
+                brands = valid_brands
 
         limit = provider_limit if provider_limit is not None else cfg.provider_limit
         if limit and limit > 0:
             brands = brands[:limit]
             logger.info("Provider limit applied: processing %s brands.", len(brands))
 
+        # Brands are I/O bound on their own data holder endpoints; each worker checks out its own
+        # pooled connection and commits one transaction per brand.
         total_products = 0
-        for idx, b in enumerate(brands, start=1):
-            pid = b.get("dataHolderBrandId")
-            name = b.get("brandName")
-            logger.info("[%s/%s] Fetching products for %s (%s)...", idx, len(brands), name, pid)
-            try:
-                with transaction(conn):
-                    n, product_ids = _fetch_products_for_brand(cfg, session, conn, run_id, run_date, b)
-                    total_products += n
-                    logger.info("  -> %s products ingested (sum of pages).", n)
-                    if cfg.fetch_product_details:
-                        ok = _fetch_product_details(cfg, session, conn, run_id, run_date, b, product_ids)
-                        logger.info("  -> %s product details ingested.", ok)
-            except Exception as e:  # noqa: BLE001
-                logger.exception("Failed brand %s (%s): %s", name, pid, e)
-                continue
+        with ThreadPoolExecutor(max_workers=max(1, cfg.ingest_workers), thread_name_prefix="ingest") as ex:
+            futures = [
+                ex.submit(_process_brand, cfg, sessions, run_id, run_date, b, idx, len(brands))
+                for idx, b in enumerate(brands, start=1)
+            ]
+            for fut in as_completed(futures):
+                n, _ok = fut.result()
+                total_products += n
 
         logger.info("Ingest complete. Total products (summed pages): %s. Run ID: %s", total_products, run_id)
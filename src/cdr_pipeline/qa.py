@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
 import os
 import shlex
 import subprocess
+import threading
 import uuid
-from contextlib import closing
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 
+from cdr_pipeline import cache
 from cdr_pipeline.bootstrap import bootstrap_db
 from cdr_pipeline.config import Config
-from cdr_pipeline.db import connect_with_retries, execute_batch, fetchall, transaction
+from cdr_pipeline.db import execute_values, fetchall, pooled, transaction
 
 
 @dataclass(frozen=True)
@@ -24,21 +31,83 @@ class GateResult:
     details: str
 
 
-def _ensure_dir(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
+_ELLIPSIS = "..."
 
 
 def _clip_text(s: str, max_chars: int = 4000) -> str:
     if len(s) <= max_chars:
         return s
-    return s[: max_chars - 3] + "..."
+    return "".join((s[: max_chars - 3], _ELLIPSIS))
 
 
-def _run_dbt_tests(command: str) -> tuple[bool, str]:
+# dbt's in-process runner, created on first use and kept for later QA runs in the same process so
+# dbt is imported and its adapter registered only once. Log lines reach _dbt_log via the callback.
+_dbt_runner: Any = None
+_dbt_log: list[str] = []
+_dbt_lock = threading.Lock()
+
+
+# Debug events reach the callback too; keep only what the dbt CLI prints by default.
+_DBT_LOG_LEVELS = frozenset({"info", "warn", "error"})
+
+
+def _collect_dbt_event(event: Any) -> None:
+    if event.info.level not in _DBT_LOG_LEVELS:
+        return
+    msg = event.info.msg
+    if msg:
+        _dbt_log.append(str(msg))
+
+
+def _run_dbt_in_process(args: list[str]) -> tuple[bool, str] | None:
+    global _dbt_runner
+    try:
+        from dbt.cli.main import dbtRunner
+    except ImportError:
+        return None
+
+    with _dbt_lock:
+        if _dbt_runner is None:
+            _dbt_runner = dbtRunner(callbacks=[_collect_dbt_event])
+        _dbt_log.clear()
+        try:
+            res = _dbt_runner.invoke(args)
+        except Exception as e:  # noqa: BLE001
+            return False, _clip_text(f"dbt test failed to run in-process: {e}")
+        combined = "\n".join(_dbt_log).strip()
+        _dbt_log.clear()
+
+    # Same exit codes as the dbt CLI: 0 success, 1 test failures, 2 dbt itself errored.
+    exit_code = 0 if res.success else (2 if res.exception is not None else 1)
+    if res.exception is not None:
+        combined = "\n".join(x for x in (combined, str(res.exception)) if x)
+    if not combined:
+        combined = "dbt test produced no output."
+    return res.success, _clip_text(f"exit_code={exit_code}\n{combined}")
+
+
+def _with_dbt_threads(command: str, threads: int) -> str:
+    # An explicit --threads in the command wins; 0 leaves the profile's threads setting alone.
+    parts = shlex.split(command)
+    if threads <= 0 or not parts or os.path.basename(parts[0]) != "dbt":
+        return command
+    if any(p.startswith("--threads") for p in parts):
+        return command
+    return f"{command} --threads {threads}"
+
+
+def _run_dbt_tests(command: str, *, isolated: bool = False) -> tuple[bool, str]:
     parts = shlex.split(command)
     if not parts:
         return False, "dbt test command is empty"
 
+    # Plain `dbt ...` commands run in-process when dbt is importable; anything else (wrappers,
+    # isolated runs, no dbt in this environment) goes through a subprocess.
+    if not isolated and os.path.basename(parts[0]) == "dbt":
+        result = _run_dbt_in_process(parts[1:])
+        if result is not None:
+            return result
+
     try:
         cp = subprocess.run(parts, capture_output=True, text=True, check=False)  # noqa: S603
     except FileNotFoundError as e:
@@ -55,26 +124,28 @@ def _run_dbt_tests(command: str) -> tuple[bool, str]:
     return cp.returncode == 0, _clip_text(f"{prefix}\n{combined}")
 
 
+def _to_number(val) -> float | None:
+    return None if val is None else float(val)
+
+
 def _fetch_number(conn, sql: str, params: tuple | None = None) -> float | None:
     rows = fetchall(conn, sql, params)
     if not rows:
         return None
-    val = rows[0][0]
-    if val is None:
-        return None
-    return float(val)
+    return _to_number(rows[0][0])
 
 
-def _relation_exists(conn, relation_name: str) -> bool:
-    rows = fetchall(conn, "SELECT to_regclass(%s)", (relation_name,))
-    return bool(rows and rows[0][0] is not None)
+def _existing_relations(conn, candidates: Iterable[str]) -> frozenset[str]:
+    # All candidate relations are probed in a single to_regclass round trip.
+    names = list(dict.fromkeys(candidates))
+    if not names:
+        return frozenset()
+    rows = fetchall(conn, "SELECT name FROM unnest(%s::text[]) AS name WHERE to_regclass(name) IS NOT NULL", (names,))
+    return frozenset(r[0] for r in rows)
 
 
-def _resolve_relation(conn, candidates: list[str]) -> str | None:
-    for relation_name in candidates:
-        if _relation_exists(conn, relation_name):
-            return relation_name
-    return None
+def _resolve_relation(existing: frozenset[str], candidates: Iterable[str]) -> str | None:
+    return next((name for name in candidates if name in existing), None)
 
 
 def _gate_min(name: str, actual_value: float | None, threshold_value: float, unit: str = "") -> GateResult:
@@ -117,8 +188,9 @@ def _gate_max(name: str, actual_value: float | None, threshold_value: float, uni
     )
 
 
-def _gate_min_from_query(
+def _gate_from_query(
     conn,
+    check: Callable[..., GateResult],
     *,
     name: str,
     threshold_value: float,
@@ -137,30 +209,284 @@ def _gate_min_from_query(
             threshold_value=threshold_value,
             details=_clip_text(f"query failed: {e}"),
         )
-    return _gate_min(name, actual_value, threshold_value, unit=unit)
+    return check(name, actual_value, threshold_value, unit=unit)
 
 
-def _gate_max_from_query(
-    conn,
+@dataclass(frozen=True)
+class _MetricGate:
+    name: str
+    check: Callable[..., GateResult]
+    threshold_value: float
+    sql: str
+    params: tuple
+    # Candidate relations for the {relation} placeholder in sql, in preference order.
+    relations: tuple[str, ...] = ()
+    unit: str = ""
+
+
+_FRESHNESS_GATE = "products_freshness_hours"
+
+
+def _hours_since(now_utc: datetime, fetched_at: datetime | None) -> float | None:
+    return None if fetched_at is None else (now_utc - fetched_at).total_seconds() / 3600.0
+
+
+def _metric_gates(
+    qa_date: date,
+    now_utc: datetime,
     *,
-    name: str,
-    threshold_value: float,
-    sql: str,
-    params: tuple | None = None,
-    unit: str = "",
-) -> GateResult:
+    min_providers: float,
+    min_products: float,
+    min_rate_changes: float,
+    max_freshness_hours: float,
+) -> list[_MetricGate]:
+    return [
+        _MetricGate(
+            name="providers_ok",
+            check=_gate_min,
+            threshold_value=min_providers,
+            sql="""
+            SELECT COUNT(*)
+            FROM {relation}
+            WHERE as_of_date = %s
+              AND COALESCE(products_pages_ok, 0) > 0
+              AND COALESCE(last_http_status, 0) IN (200, 304)
+            """,
+            params=(qa_date,),
+            relations=("gold.mart_provider_coverage", "public_gold.mart_provider_coverage"),
+        ),
+        _MetricGate(
+            name="dim_products_rows",
+            check=_gate_min,
+            threshold_value=min_products,
+            sql="""
+            SELECT COUNT(*)
+            FROM {relation}
+            WHERE as_of_date = %s
+            """,
+            params=(qa_date,),
+            relations=("silver.dim_products", "public_silver.dim_products"),
+        ),
+        _MetricGate(
+            name="rate_changes_rows",
+            check=_gate_min,
+            threshold_value=min_rate_changes,
+            sql="""
+            SELECT COUNT(*)
+            FROM {relation}
+            WHERE current_as_of_date = %s
+            """,
+            params=(qa_date,),
+            relations=("gold.mart_rate_changes", "public_gold.mart_rate_changes"),
+        ),
+        _MetricGate(
+            name=_FRESHNESS_GATE,
+            check=_gate_max,
+            threshold_value=max_freshness_hours,
+            sql="""
+            SELECT EXTRACT(EPOCH FROM ((%s::timestamptz) - MAX(fetched_at))) / 3600.0
+            FROM raw.products_raw
+            """,
+            params=(now_utc,),
+            unit="h",
+        ),
+    ]
+
+
+def _gate_sql(gate: _MetricGate, existing: frozenset[str]) -> str | None:
+    if not gate.relations:
+        return gate.sql
+    relation = _resolve_relation(existing, gate.relations)
+    return None if relation is None else gate.sql.format(relation=relation)
+
+
+def _missing_relation_result(gate: _MetricGate) -> GateResult:
+    return GateResult(
+        name=gate.name,
+        passed=False,
+        actual_value=None,
+        threshold_value=gate.threshold_value,
+        details=f"missing relation: expected {' or '.join(gate.relations)}",
+    )
+
+
+def _evaluate_metric_gate(conn, gate: _MetricGate, existing: frozenset[str]) -> GateResult:
+    sql = _gate_sql(gate, existing)
+    if sql is None:
+        return _missing_relation_result(gate)
+    return _gate_from_query(
+        conn,
+        gate.check,
+        name=gate.name,
+        threshold_value=gate.threshold_value,
+        sql=sql,
+        params=gate.params,
+        unit=gate.unit,
+    )
+
+
+_SCHEMA_DRIFT_SQL = """
+SELECT COUNT(*)
+FROM bronze.schema_drift_event
+WHERE observed_at::date = %s
+"""
+
+
+def _schema_drift_gate(conn, qa_date: date, fail_on_schema_drift: bool) -> GateResult:
     try:
-        actual_value = _fetch_number(conn, sql, params)
+        drift_events = _fetch_number(conn, _SCHEMA_DRIFT_SQL, (qa_date,))
     except Exception as e:  # noqa: BLE001
         conn.rollback()
         return GateResult(
-            name=name,
+            name="schema_drift_events",
             passed=False,
             actual_value=None,
-            threshold_value=threshold_value,
+            threshold_value=0.0 if fail_on_schema_drift else None,
             details=_clip_text(f"query failed: {e}"),
         )
-    return _gate_max(name, actual_value, threshold_value, unit=unit)
+    return _schema_drift_result(drift_events, fail_on_schema_drift)
+
+
+def _schema_drift_result(drift_events: float | None, fail_on_schema_drift: bool) -> GateResult:
+    if fail_on_schema_drift:
+        return _gate_max("schema_drift_events", drift_events, 0.0)
+    return GateResult(
+        name="schema_drift_events",
+        passed=True,
+        actual_value=drift_events,
+        threshold_value=None,
+        details=f"observed={drift_events}; fail gate disabled",
+    )
+
+
+def _batched_gate_results(
+    conn, gates: list[_MetricGate], existing: frozenset[str], qa_date: date, fail_on_schema_drift: bool
+) -> list[GateResult] | None:
+    # Every metric as a scalar subquery of one SELECT: one round trip and one snapshot for all gates.
+    # Gates whose relation is missing fail without touching the database. Returns None when the
+    # statement fails, so the caller can fall back to per-gate queries that report which gate is affected.
+    gate_sqls = [_gate_sql(gate, existing) for gate in gates]
+    subqueries: list[str] = []
+    params: list[Any] = []
+    for gate, gate_sql in zip(gates, gate_sqls, strict=True):
+        if gate_sql is not None:
+            subqueries.append(f"({gate_sql})")
+            params.extend(gate.params)
+    subqueries.append(f"({_SCHEMA_DRIFT_SQL})")
+    params.append(qa_date)
+    try:
+        rows = fetchall(conn, "SELECT " + ", ".join(subqueries), tuple(params))
+    except Exception:  # noqa: BLE001
+        conn.rollback()
+        return None
+    values = iter([_to_number(v) for v in rows[0]])
+    results = [
+        _missing_relation_result(gate)
+        if gate_sql is None
+        else gate.check(gate.name, next(values), gate.threshold_value, unit=gate.unit)
+        for gate, gate_sql in zip(gates, gate_sqls, strict=True)
+    ]
+    results.append(_schema_drift_result(next(values), fail_on_schema_drift))
+    return results
+
+
+def _run_gate(cfg: Config, gate: Callable[[Any], GateResult]) -> GateResult:
+    with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn:
+        return gate(conn)
+
+
+def _evaluate_gates(
+    cfg: Config, metric_gates: list[_MetricGate], qa_date: date, fail_on_schema_drift: bool
+) -> list[GateResult]:
+    with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn:
+        existing = _existing_relations(conn, (name for gate in metric_gates for name in gate.relations))
+        batched = _batched_gate_results(conn, metric_gates, existing, qa_date, fail_on_schema_drift)
+    if batched is not None:
+        return batched
+
+    gates: list[Callable[[Any], GateResult]] = [
+        functools.partial(_evaluate_metric_gate, gate=gate, existing=existing) for gate in metric_gates
+    ]
+    gates.append(functools.partial(_schema_drift_gate, qa_date=qa_date, fail_on_schema_drift=fail_on_schema_drift))
+
+    # The per-gate queries are independent reads, so each runs on its own pooled connection.
+    run_gate = functools.partial(_run_gate, cfg)
+    if cfg.qa_parallel_gates:
+        with ThreadPoolExecutor(max_workers=max(1, min(len(gates), cfg.pg_pool_max)), thread_name_prefix="qa") as ex:
+            return list(ex.map(run_gate, gates))
+    return [run_gate(gate) for gate in gates]
+
+
+_QA_CACHE_DIR = os.path.join("reports", ".qa_cache")
+
+
+def _qa_snapshot(conn, relations: list[str]) -> list[Any]:
+    # Changes whenever ingest loads new pages, drift is recorded or dbt rebuilds a mart (new table OID).
+    rows = fetchall(
+        conn,
+        """
+        SELECT
+          (SELECT MAX(fetched_at) FROM raw.products_raw),
+          (SELECT MAX(observed_at) FROM bronze.schema_drift_event),
+          ARRAY(
+            SELECT to_regclass(t.name)::oid::bigint
+            FROM unnest(%s::text[]) WITH ORDINALITY AS t(name, ord)
+            ORDER BY t.ord
+          )
+        """,
+        (relations,),
+    )
+    return list(rows[0])
+
+
+_DBT_CACHE_DIR = os.path.join("reports", ".dbt_cache")
+_DBT_CACHE_MAX_ENTRIES = 32
+_DBT_PROJECT_SUFFIXES = (".sql", ".yml", ".yaml", ".csv", ".py")
+_DBT_PROJECT_SKIP_DIRS = frozenset({"target", "logs", "data", "reports"})
+
+
+def _dbt_project_dir(command: str) -> str:
+    parts = shlex.split(command)
+    for i, part in enumerate(parts):
+        if part == "--project-dir" and i + 1 < len(parts):
+            return parts[i + 1]
+        if part.startswith("--project-dir="):
+            return part.split("=", 1)[1]
+    return "."
+
+
+def _dbt_project_files(project_dir: str) -> list[tuple[str, int, int]]:
+    # (path, mtime_ns, size) for every model, test, seed and config file; dbt's own output is skipped.
+    files: list[tuple[str, int, int]] = []
+    stack = [project_dir]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and entry.name not in _DBT_PROJECT_SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(_DBT_PROJECT_SUFFIXES):
+                        st = entry.stat()
+                        files.append((entry.path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            continue
+    files.sort()
+    return files
+
+
+def _cached_dbt_tests(command: str, *, isolated: bool, snapshot: list[Any] | None) -> tuple[bool, str]:
+    # A passing run is reused while the command, the dbt project files and the data snapshot are unchanged.
+    if snapshot is None:
+        return _run_dbt_tests(command, isolated=isolated)
+    key = cache.cache_key(command, _dbt_project_files(_dbt_project_dir(command)), snapshot)
+    hit = cache.load(_DBT_CACHE_DIR, key, ttl_seconds=float("inf"))
+    if hit is not None:
+        return True, _clip_text(f"reused cached dbt test result\n{hit}")
+    passed, details = _run_dbt_tests(command, isolated=isolated)
+    if passed:
+        cache.store(_DBT_CACHE_DIR, key, details, ttl_seconds=float("inf"), max_entries=_DBT_CACHE_MAX_ENTRIES)
+    return passed, details
 
 
 def run_qa(
@@ -173,6 +499,7 @@ def run_qa(
     fail_on_schema_drift: bool | None = None,
     run_dbt_tests: bool | None = None,
     dbt_test_command: str | None = None,
+    use_cache: bool = True,
 ) -> int:
     load_dotenv(override=False)
     cfg = Config.from_env()
@@ -185,152 +512,67 @@ def run_qa(
     threshold_fail_on_schema_drift = fail_on_schema_drift if fail_on_schema_drift is not None else cfg.qa_fail_on_schema_drift
     should_run_dbt_tests = run_dbt_tests if run_dbt_tests is not None else cfg.qa_run_dbt_tests
     effective_dbt_test_command = dbt_test_command if dbt_test_command is not None else cfg.qa_dbt_test_command
+    # Only parsed when dbt actually runs, so a malformed command cannot fail a run that skips it.
+    if should_run_dbt_tests:
+        effective_dbt_test_command = _with_dbt_threads(effective_dbt_test_command, cfg.qa_dbt_threads)
 
     qa_date = run_dt.date()
     now_utc = datetime.now(timezone.utc)
     qa_run_id = str(uuid.uuid4())
 
-    dbt_passed = True
-    dbt_details = "dbt test skipped"
-    if should_run_dbt_tests:
-        dbt_passed, dbt_details = _run_dbt_tests(effective_dbt_test_command)
-
-    gate_results: list[GateResult] = []
-
-    with closing(connect_with_retries(cfg.pg_dsn(), autocommit=False)) as conn:
-        provider_coverage_rel = _resolve_relation(conn, ["gold.mart_provider_coverage", "public_gold.mart_provider_coverage"])
-        if provider_coverage_rel:
-            gate_results.append(
-                _gate_min_from_query(
-                    conn,
-                    name="providers_ok",
-                    threshold_value=float(threshold_min_providers),
-                    sql=f"""
-                    SELECT COUNT(*)
-                    FROM {provider_coverage_rel}
-                    WHERE as_of_date = %s
-                      AND COALESCE(products_pages_ok, 0) > 0
-                      AND COALESCE(last_http_status, 0) IN (200, 304)
-                    """,
-                    params=(qa_date,),
-                )
-            )
-        else:
-            gate_results.append(
-                GateResult(
-                    name="providers_ok",
-                    passed=False,
-                    actual_value=None,
-                    threshold_value=float(threshold_min_providers),
-                    details="missing relation: expected gold.mart_provider_coverage or public_gold.mart_provider_coverage",
-                )
-            )
-
-        dim_products_rel = _resolve_relation(conn, ["silver.dim_products", "public_silver.dim_products"])
-        if dim_products_rel:
-            gate_results.append(
-                _gate_min_from_query(
-                    conn,
-                    name="dim_products_rows",
-                    threshold_value=float(threshold_min_products),
-                    sql=f"""
-                    SELECT COUNT(*)
-                    FROM {dim_products_rel}
-                    WHERE as_of_date = %s
-                    """,
-                    params=(qa_date,),
-                )
-            )
-        else:
-            gate_results.append(
-                GateResult(
-                    name="dim_products_rows",
-                    passed=False,
-                    actual_value=None,
-                    threshold_value=float(threshold_min_products),
-                    details="missing relation: expected silver.dim_products or public_silver.dim_products",
-                )
-            )
-
-        rate_changes_rel = _resolve_relation(conn, ["gold.mart_rate_changes", "public_gold.mart_rate_changes"])
-        if rate_changes_rel:
-            gate_results.append(
-                _gate_min_from_query(
-                    conn,
-                    name="rate_changes_rows",
-                    threshold_value=float(threshold_min_rate_changes),
-                    sql=f"""
-                    SELECT COUNT(*)
-                    FROM {rate_changes_rel}
-                    WHERE current_as_of_date = %s
-                    """,
-                    params=(qa_date,),
-                )
-            )
-        else:
-            gate_results.append(
-                GateResult(
-                    name="rate_changes_rows",
-                    passed=False,
-                    actual_value=None,
-                    threshold_value=float(threshold_min_rate_changes),
-                    details="missing relation: expected gold.mart_rate_changes or public_gold.mart_rate_changes",
-                )
-            )
+    metric_gates = _metric_gates(
+        qa_date,
+        now_utc,
+        min_providers=float(threshold_min_providers),
+        min_products=float(threshold_min_products),
+        min_rate_changes=float(threshold_min_rate_changes),
+        max_freshness_hours=float(threshold_max_freshness_hours),
+    )
 
-        gate_results.append(
-            _gate_max_from_query(
-                conn,
-                name="products_freshness_hours",
-                threshold_value=float(threshold_max_freshness_hours),
-                sql="""
-                SELECT EXTRACT(EPOCH FROM ((%s::timestamptz) - MAX(fetched_at))) / 3600.0
-                FROM raw.products_raw
-                """,
-                params=(now_utc,),
-                unit="h",
-            )
+    use_qa_cache = use_cache and cfg.qa_cache_ttl_seconds > 0
+    use_dbt_cache = use_cache and should_run_dbt_tests and cfg.qa_dbt_cache_enabled
+    snapshot = None
+    if use_qa_cache or use_dbt_cache:
+        with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn:
+            snapshot = _qa_snapshot(conn, [name for gate in metric_gates for name in gate.relations])
+
+    key = None
+    cached = None
+    if use_qa_cache:
+        key = cache.cache_key(
+            qa_date.isoformat(),
+            [threshold_min_providers, threshold_min_products, threshold_min_rate_changes, threshold_max_freshness_hours],
+            threshold_fail_on_schema_drift,
+            effective_dbt_test_command if should_run_dbt_tests else None,
+            _dbt_project_files(_dbt_project_dir(effective_dbt_test_command)) if should_run_dbt_tests else None,
+            snapshot,
         )
+        cached = cache.load(_QA_CACHE_DIR, key, cfg.qa_cache_ttl_seconds)
 
-        drift_events: float | None
-        try:
-            drift_events = _fetch_number(
-                conn,
-                """
-                SELECT COUNT(*)
-                FROM bronze.schema_drift_event
-                WHERE observed_at::date = %s
-                """,
-                (qa_date,),
-            )
-        except Exception as e:  # noqa: BLE001
-            conn.rollback()
-            drift_events = None
-            gate_results.append(
-                GateResult(
-                    name="schema_drift_events",
-                    passed=False,
-                    actual_value=None,
-                    threshold_value=0.0 if threshold_fail_on_schema_drift else None,
-                    details=_clip_text(f"query failed: {e}"),
-                )
-            )
-            drift_events = None
-
-        drift_threshold = 0.0 if threshold_fail_on_schema_drift else float("inf")
-        if not any(gr.name == "schema_drift_events" for gr in gate_results) and threshold_fail_on_schema_drift:
-            gate_results.append(_gate_max("schema_drift_events", drift_events, drift_threshold))
-        elif not any(gr.name == "schema_drift_events" for gr in gate_results):
-            gate_results.append(
-                GateResult(
-                    name="schema_drift_events",
-                    passed=True,
-                    actual_value=drift_events,
-                    threshold_value=None,
-                    details=f"observed={drift_events}; fail gate disabled",
+    if cached is not None:
+        # Freshness depends on the clock, so it is re-evaluated from the snapshot's MAX(fetched_at).
+        freshness = next(gate for gate in metric_gates if gate.name == _FRESHNESS_GATE)
+        freshness_result = freshness.check(
+            freshness.name, _hours_since(now_utc, snapshot[0]), freshness.threshold_value, unit=freshness.unit
+        )
+        gate_results = [freshness_result if gr["name"] == _FRESHNESS_GATE else GateResult(**gr) for gr in cached]
+        dbt_passed = gate_results[-1].passed
+        print(f"Reusing cached QA gate results (younger than {cfg.qa_cache_ttl_seconds:g}s; --no-cache re-runs them).")
+    else:
+        # dbt test only reads the marts, so it runs alongside the gate queries instead of before them.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="qa-dbt") as ex:
+            dbt_future = (
+                ex.submit(
+                    _cached_dbt_tests,
+                    effective_dbt_test_command,
+                    isolated=cfg.qa_dbt_isolated,
+                    snapshot=snapshot if use_dbt_cache else None,
                 )
+                if should_run_dbt_tests
+                else None
             )
-
+            gate_results = _evaluate_gates(cfg, metric_gates, qa_date, threshold_fail_on_schema_drift)
+            dbt_passed, dbt_details = dbt_future.result() if dbt_future is not None else (True, "dbt test skipped")
         dbt_gate = GateResult(
             name="dbt_tests",
             passed=dbt_passed,
@@ -339,59 +581,63 @@ def run_qa(
             details=dbt_details if should_run_dbt_tests else "skipped",
         )
         gate_results.append(dbt_gate)
-
-        with transaction(conn):
-            rows = [
-                (
-                    qa_run_id,
-                    qa_date,
-                    now_utc,
-                    gr.name,
-                    gr.passed,
-                    gr.actual_value,
-                    gr.threshold_value,
-                    gr.details,
-                    should_run_dbt_tests,
-                    dbt_passed,
-                    effective_dbt_test_command if should_run_dbt_tests else None,
-                )
-                for gr in gate_results
-            ]
-            execute_batch(
-                conn,
-                """
-                INSERT INTO bronze.qa_gate_result (
-                    qa_run_id, qa_date, evaluated_at, gate_name, passed, actual_value, threshold_value, details,
-                    dbt_test_ran, dbt_test_passed, dbt_test_command
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                rows,
+        # Only passing runs are cached, so a fix is always picked up by the next run.
+        if key is not None and all(gr.passed for gr in gate_results):
+            cache.store(_QA_CACHE_DIR, key, [dataclasses.asdict(gr) for gr in gate_results], cfg.qa_cache_ttl_seconds)
+
+    dbt_command = effective_dbt_test_command if should_run_dbt_tests else None
+    with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn, transaction(conn):
+        rows = [
+            (
+                qa_run_id,
+                qa_date,
+                now_utc,
+                gr.name,
+                gr.passed,
+                gr.actual_value,
+                gr.threshold_value,
+                gr.details,
+                should_run_dbt_tests,
+                dbt_passed,
+                dbt_command,
             )
+            for gr in gate_results
+        ]
+        execute_values(
+            conn,
+            """
+            INSERT INTO bronze.qa_gate_result (
+                qa_run_id, qa_date, evaluated_at, gate_name, passed, actual_value, threshold_value, details,
+                dbt_test_ran, dbt_test_passed, dbt_test_command
+            )
+            VALUES %s
+            """,
+            rows,
+        )
 
-    _ensure_dir("reports")
-    qa_date_str = qa_date.strftime("%Y-%m-%d")
-    summary_path = os.path.join("reports", f"qa_summary_{qa_date_str}.md")
+    reports_dir = Path("reports")
+    reports_dir.mkdir(exist_ok=True)
+    qa_date_str = qa_date.isoformat()
+    summary_path = reports_dir / f"qa_summary_{qa_date_str}.md"
     failed = [gr for gr in gate_results if not gr.passed]
+    status = "PASS" if not failed else "FAIL"
+    parts = [
+        f"# QA summary - {qa_date_str}\n\n",
+        f"- Status: **{status}**\n",
+        f"- QA run id: `{qa_run_id}`\n",
+        f"- dbt tests: **{'PASS' if dbt_passed else 'FAIL'}**",
+        f" (`{effective_dbt_test_command}`)\n\n" if should_run_dbt_tests else " (skipped)\n\n",
+        "| Gate | Passed | Actual | Threshold | Details |\n",
+        "|---|---|---:|---:|---|\n",
+    ]
+    for gr in gate_results:
+        actual = "" if gr.actual_value is None else str(gr.actual_value)
+        threshold = "" if gr.threshold_value is None else str(gr.threshold_value)
+        parts.append(f"| {gr.name} | {'yes' if gr.passed else 'no'} | {actual} | {threshold} | {gr.details} |\n")
     with open(summary_path, "w", encoding="utf-8") as f:
-        f.write(f"# QA summary - {qa_date_str}\n\n")
-        status = "PASS" if not failed else "FAIL"
-        f.write(f"- Status: **{status}**\n")
-        f.write(f"- QA run id: `{qa_run_id}`\n")
-        f.write(f"- dbt tests: **{'PASS' if dbt_passed else 'FAIL'}**")
-        if should_run_dbt_tests:
-            f.write(f" (`{effective_dbt_test_command}`)\n\n")
-        else:
-            f.write(" (skipped)\n\n")
-
-        f.write("| Gate | Passed | Actual | Threshold | Details |\n")
-        f.write("|---|---|---:|---:|---|\n")
-        for gr in gate_results:
-            actual = "" if gr.actual_value is None else str(gr.actual_value)
-            threshold = "" if gr.threshold_value is None else str(gr.threshold_value)
-            f.write(f"| {gr.name} | {'yes' if gr.passed else 'no'} | {actual} | {threshold} | {gr.details} |\n")
-
-    print(f"Wrote QA summary: {os.path.abspath(summary_path)}")
+        f.write("".join(parts))
+
+    print(f"Wrote QA summary: {summary_path.absolute()}")
     if failed:
         print("QA failed gates:")
         for gr in failed:
@@ -1,167 +1,221 @@
 from __future__ import annotations
 
 import csv
+import itertools
 import os
-from contextlib import closing
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
 from dotenv import load_dotenv
 
 from cdr_pipeline.config import Config
-from cdr_pipeline.db import connect_with_retries, fetchall
-
-
-def _ensure_dir(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
-
-
-def _write_csv(path: str, headers: list[str], rows: list[tuple]) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(headers)
-        for r in rows:
-            w.writerow(list(r))
+from cdr_pipeline.db import fetchall, iter_rows, pooled
+
+_TOP_RATE_CHANGES = 20
+
+
+def _write_csv(path: Path, headers: list[str], rows: Iterable[tuple]) -> None:
+    # Rows may stream from a cursor that fails midway, so write-then-rename: a failed export never
+    # leaves a truncated CSV at `path`. A 1 MiB buffer keeps large exports to a few write() calls.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            w = csv.writer(f)
+            w.writerow(headers)
+            w.writerows(rows)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _keep_head(rows: Iterable[tuple], head: list[tuple], n: int) -> Iterator[tuple]:
+    for r in rows:
+        if len(head) < n:
+            head.append(r)
+        yield r
+
+
+def _count_coverage(rows: Iterable[tuple], counts: list[int]) -> Iterator[tuple]:
+    # counts = [providers discovered, providers with an OK product fetch]
+    for r in rows:
+        counts[0] += 1
+        if (r[6] in (200, 304)) and (r[4] or 0) > 0:
+            counts[1] += 1
+        yield r
+
+
+# The mart sections stream rows through server-side cursors straight into the CSV files, so memory
+# stays flat however many rows they hold. Those cursors need a transaction, so their pooled
+# connections are not autocommit; the pool rolls them back on release.
+def _rate_changes_section(cfg: Config, reports_dir: Path, report_date: str) -> list[tuple]:
+    top: list[tuple] = []
+    with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn:
+        rows = iter_rows(
+            conn,
+            """
+            SELECT
+              provider_id,
+              brand_name,
+              product_id,
+              product_name,
+              product_category,
+              rate_kind,
+              rate_type,
+              tier_name,
+              previous_as_of_date,
+              current_as_of_date,
+              previous_rate,
+              current_rate,
+              (current_rate - previous_rate) AS delta
+            FROM gold.mart_rate_changes
+            ORDER BY abs(current_rate - previous_rate) DESC NULLS LAST
+            LIMIT %s
+            """,
+            # Without the CSV only the markdown's top rows are needed.
+            (200 if cfg.report_rate_changes_csv else _TOP_RATE_CHANGES,),
+        )
+        if not cfg.report_rate_changes_csv:
+            return list(rows)
+        first = next(rows, None)
+        if first is not None:
+            _write_csv(
+                reports_dir / f"rate_changes_{report_date}.csv",
+                [
+                    "provider_id",
+                    "brand_name",
+                    "product_id",
+                    "product_name",
+                    "product_category",
+                    "rate_kind",
+                    "rate_type",
+                    "tier_name",
+                    "previous_as_of_date",
+                    "current_as_of_date",
+                    "previous_rate",
+                    "current_rate",
+                    "delta",
+                ],
+                _keep_head(itertools.chain((first,), rows), top, _TOP_RATE_CHANGES),
+            )
+    return top
+
+
+def _coverage_section(cfg: Config, reports_dir: Path, report_date: str) -> list[int]:
+    counts = [0, 0]
+    with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn:
+        rows = iter_rows(
+            conn,
+            """
+            SELECT
+              as_of_date,
+              provider_id,
+              brand_name,
+              expected_base_uri,
+              products_pages_ok,
+              products_rows,
+              last_http_status,
+              last_error
+            FROM gold.mart_provider_coverage
+            ORDER BY brand_name
+            """,
+        )
+        first = next(rows, None)
+        if first is not None:
+            _write_csv(
+                reports_dir / f"provider_coverage_{report_date}.csv",
+                ["as_of_date", "provider_id", "brand_name", "expected_base_uri", "products_pages_ok", "products_rows", "last_http_status", "last_error"],
+                _count_coverage(itertools.chain((first,), rows), counts),
+            )
+    return counts
+
+
+def _drift_section(cfg: Config) -> list[tuple]:
+    with pooled(cfg.pg_dsn(), maxconn=cfg.pg_pool_max) as conn:
+        return fetchall(
+            conn,
+            """
+            SELECT provider_id, endpoint, old_fingerprint_hash, new_fingerprint_hash, observed_at
+            FROM bronze.schema_drift_event
+            ORDER BY observed_at DESC
+            LIMIT 50
+            """,
+        )
 
 
 def run_report(run_dt: datetime) -> None:
     load_dotenv(override=False)
     cfg = Config.from_env()
-    with closing(connect_with_retries(cfg.pg_dsn(), autocommit=True)) as conn:
-        report_date = run_dt.strftime("%Y-%m-%d")
-        _ensure_dir("reports")
+    report_date = run_dt.date().isoformat()
+    reports_dir = Path("reports")
+    reports_dir.mkdir(exist_ok=True)
+
+    errors: list[str] = []
+    rate_changes: list[tuple] = []
+    coverage_counts = [0, 0]
+    drift: list[tuple] = []
 
-        errors: list[str] = []
+    # The three sections read independent relations, so each runs on its own pooled connection.
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="report") as ex:
+        rate_future = ex.submit(_rate_changes_section, cfg, reports_dir, report_date)
+        coverage_future = ex.submit(_coverage_section, cfg, reports_dir, report_date)
+        drift_future = ex.submit(_drift_section, cfg)
 
         try:
-            rate_changes = fetchall(
-                conn,
-                """
-                SELECT
-                  provider_id,
-                  brand_name,
-                  product_id,
-                  product_name,
-                  product_category,
-                  rate_kind,
-                  rate_type,
-                  tier_name,
-                  previous_as_of_date,
-                  current_as_of_date,
-                  previous_rate,
-                  current_rate,
-                  (current_rate - previous_rate) AS delta
-                FROM gold.mart_rate_changes
-                ORDER BY abs(current_rate - previous_rate) DESC NULLS LAST
-                LIMIT 200
-                """,
-            )
+            rate_changes = rate_future.result()
         except Exception as e:  # noqa: BLE001
-            rate_changes = []
             errors.append(f"gold.mart_rate_changes not available (run dbt?): {e}")
 
         try:
-            coverage = fetchall(
-                conn,
-                """
-                SELECT
-                  as_of_date,
-                  provider_id,
-                  brand_name,
-                  expected_base_uri,
-                  products_pages_ok,
-                  products_rows,
-                  last_http_status,
-                  last_error
-                FROM gold.mart_provider_coverage
-                ORDER BY brand_name
-                """,
-            )
+            coverage_counts = coverage_future.result()
         except Exception as e:  # noqa: BLE001
-            coverage = []
             errors.append(f"gold.mart_provider_coverage not available (run dbt?): {e}")
 
         try:
-            drift = fetchall(
-                conn,
-                """
-                SELECT provider_id, endpoint, old_fingerprint_hash, new_fingerprint_hash, observed_at
-                FROM bronze.schema_drift_event
-                ORDER BY observed_at DESC
-                LIMIT 50
-                """,
-            )
+            drift = drift_future.result()
         except Exception as e:  # noqa: BLE001
-            drift = []
             errors.append(f"bronze.schema_drift_event not available: {e}")
 
-    if rate_changes:
-        rate_csv = os.path.join("reports", f"rate_changes_{report_date}.csv")
-        _write_csv(
-            rate_csv,
-            [
-                "provider_id",
-                "brand_name",
-                "product_id",
-                "product_name",
-                "product_category",
-                "rate_kind",
-                "rate_type",
-                "tier_name",
-                "previous_as_of_date",
-                "current_as_of_date",
-                "previous_rate",
-                "current_rate",
-                "delta",
-            ],
-            rate_changes,
-        )
+    md_path = reports_dir / f"pipeline_summary_{report_date}.md"
+    parts = [f"# Pipeline summary — {report_date}\n\n"]
 
-    if coverage:
-        cov_csv = os.path.join("reports", f"provider_coverage_{report_date}.csv")
-        _write_csv(
-            cov_csv,
-            ["as_of_date", "provider_id", "brand_name", "expected_base_uri", "products_pages_ok", "products_rows", "last_http_status", "last_error"],
-            coverage,
-        )
+    if errors:
+        parts.append("## Notes\n\n")
+        parts.extend(f"- {e}\n" for e in errors)
+        parts.append("\n")
+
+    if coverage_counts[0]:
+        total, ok = coverage_counts
+        parts.append("## Coverage\n\n")
+        parts.append(f"- Providers discovered: **{total}**\n")
+        parts.append(f"- Providers with OK product fetch: **{ok}**\n\n")
+
+    if rate_changes:
+        parts.append(f"## Top rate changes (max {_TOP_RATE_CHANGES})\n\n")
+        parts.append("| Brand | Product | Category | Rate type | Tier | Previous | Current | Δ |\n")
+        parts.append("|---|---|---|---|---:|---:|---:|---:|\n")
+        for r in rate_changes:
+            brand = r[1]
+            product = r[3] or r[2]
+            cat = r[4] or ""
+            rate_type = f"{r[5]}/{r[6]}"
+            tier = r[7] or ""
+            prev = r[10]
+            cur = r[11]
+            delta = r[12]
+            parts.append(f"| {brand} | {product} | {cat} | {rate_type} | {tier} | {prev} | {cur} | {delta} |\n")
+        parts.append("\n")
+
+    if drift:
+        parts.append("## Schema drift events (last 10)\n\n")
+        parts.extend(f"- {r[4]} — provider={r[0]} endpoint={r[1]} old={r[2]} new={r[3]}\n" for r in drift[:10])
+        parts.append("\n")
 
-    md_path = os.path.join("reports", f"pipeline_summary_{report_date}.md")
     with open(md_path, "w", encoding="utf-8") as f:
-        f.write(f"# Pipeline summary — {report_date}\n\n")
-
-        if errors:
-            f.write("## Notes\n\n")
-            for e in errors:
-                f.write(f"- {e}\n")
-            f.write("\n")
-
-        if coverage:
-            total = len(coverage)
-            ok = sum(1 for r in coverage if (r[6] in (200, 304)) and (r[4] or 0) > 0)
-            f.write("## Coverage\n\n")
-            f.write(f"- Providers discovered: **{total}**\n")
-            f.write(f"- Providers with OK product fetch: **{ok}**\n\n")
-
-        if rate_changes:
-            f.write("## Top rate changes (max 20)\n\n")
-            f.write("| Brand | Product | Category | Rate type | Tier | Previous | Current | Δ |\n")
-            f.write("|---|---|---|---|---:|---:|---:|---:|\n")
-            for r in rate_changes[:20]:
-                brand = r[1]
-                product = r[3] or r[2]
-                cat = r[4] or ""
-                rate_type = f"{r[5]}/{r[6]}"
-                tier = r[7] or ""
-                prev = r[10]
-                cur = r[11]
-                delta = r[12]
-                f.write(f"| {brand} | {product} | {cat} | {rate_type} | {tier} | {prev} | {cur} | {delta} |\n")
-            f.write("\n")
-
-        if drift:
-            f.write("## Schema drift events (last 10)\n\n")
-            for r in drift[:10]:
-                f.write(f"- {r[4]} — provider={r[0]} endpoint={r[1]} old={r[2]} new={r[3]}\n")
-            f.write("\n")
-
-    print(f"Wrote reports to: {os.path.abspath('reports')}")
+        f.write("".join(parts))
+
+    print(f"Wrote reports to: {reports_dir.absolute()}")
     print(f"- {md_path}")
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+import time
+
+from cdr_pipeline import cache
+
+
+def test_cache_key_is_stable_and_order_sensitive():
+    assert cache.cache_key("2026-02-10", [1, 2]) == cache.cache_key("2026-02-10", [1, 2])
+    assert cache.cache_key("2026-02-10", [1, 2]) != cache.cache_key("2026-02-10", [2, 1])
+
+
+def test_store_then_load_round_trips(tmp_path):
+    directory = str(tmp_path / ".qa_cache")
+    cache.store(directory, "k", [{"name": "x", "passed": True}], ttl_seconds=60)
+    assert cache.load(directory, "k", ttl_seconds=60) == [{"name": "x", "passed": True}]
+    assert cache.load(directory, "missing", ttl_seconds=60) is None
+
+
+def test_load_ignores_expired_entries(tmp_path, monkeypatch):
+    directory = str(tmp_path)
+    cache.store(directory, "k", 1, ttl_seconds=60)
+    now = time.time()
+    monkeypatch.setattr(cache.time, "time", lambda: now + 120)
+    assert cache.load(directory, "k", ttl_seconds=60) is None
+
+
+def test_store_keeps_only_the_most_recent_entries(tmp_path):
+    directory = str(tmp_path)
+    for i in range(4):
+        cache.store(directory, f"k{i}", i, ttl_seconds=float("inf"), max_entries=2)
+        os.utime(tmp_path / f"k{i}.json", (1000 + i, 1000 + i))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["k2.json", "k3.json"]
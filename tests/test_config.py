@@ -4,7 +4,7 @@ import os
 
 import pytest
 
-from cdr_pipeline.config import Config
+from cdr_pipeline.config import Config, _parse_csv_ints
 
 
 @pytest.fixture(autouse=True)
@@ -22,11 +22,19 @@ def clear_config_env():
         "QA_FAIL_ON_SCHEMA_DRIFT",
         "QA_RUN_DBT_TESTS",
         "QA_DBT_TEST_COMMAND",
+        "QA_DBT_ISOLATED",
+        "QA_DBT_THREADS",
+        "QA_DBT_CACHE_ENABLED",
+        "QA_PARALLEL_GATES",
+        "QA_CACHE_TTL_SECONDS",
+        "REPORT_RATE_CHANGES_CSV",
     ]
     old = {k: os.environ.get(k) for k in keys}
     for k in keys:
         os.environ.pop(k, None)
+    Config.reset_cache()
     yield
+    Config.reset_cache()
     for k, v in old.items():
         if v is None:
             os.environ.pop(k, None)
@@ -47,6 +55,20 @@ def test_config_defaults():
     assert cfg.qa_fail_on_schema_drift is False
     assert cfg.qa_run_dbt_tests is True
     assert cfg.qa_dbt_test_command == "dbt test --project-dir dbt --profiles-dir dbt"
+    assert cfg.qa_dbt_isolated is False
+    assert cfg.qa_dbt_threads == 8
+    assert cfg.qa_dbt_cache_enabled is False
+    assert cfg.qa_parallel_gates is True
+    assert cfg.qa_cache_ttl_seconds == 3600
+    assert cfg.report_rate_changes_csv is True
+
+
+def test_config_from_env_is_cached_until_reset():
+    cfg = Config.from_env()
+    os.environ["POSTGRES_PORT"] = "6543"
+    assert Config.from_env() is cfg
+    Config.reset_cache()
+    assert Config.from_env().pg_port == 6543
 
 
 def test_config_invalid_integer_raises():
@@ -65,3 +87,9 @@ def test_config_invalid_qa_float_raises():
     os.environ["QA_MAX_FRESHNESS_HOURS"] = "fast"
     with pytest.raises(ValueError, match="QA_MAX_FRESHNESS_HOURS"):
         Config.from_env()
+
+
+def test_parse_csv_ints_skips_invalid_parts():
+    assert _parse_csv_ints("5, 4,,x,-1,+2,3.0") == (5, 4, -1, 2)
+    assert _parse_csv_ints("") == ()
+    assert _parse_csv_ints(None) == ()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from cdr_pipeline.drift import _cached_fingerprint, _distinct_observed_at, fingerprint_payload
+
+
+def test_fingerprint_paths_dotted_with_list_markers():
+    payload = {"data": {"products": [{"productId": "p1", "fees": [{"amount": "1"}]}]}, "links": {"next": None}}
+    _, paths = fingerprint_payload(payload)
+    assert paths == [
+        "data",
+        "data.products",
+        "data.products[]",
+        "data.products[].fees",
+        "data.products[].fees[]",
+        "data.products[].productId",
+        "links",
+        "links.next",
+    ]
+
+
+def test_fingerprint_root_list_and_empty_key():
+    _, paths = fingerprint_payload([{"": {"a": 1}}])
+    assert paths == ["[]", "[].", "[]..a"]
+    _, paths = fingerprint_payload({"": [{"a": 1}]})
+    assert paths == ["", "[]", "[].a"]
+
+
+def test_fingerprint_respects_max_depth():
+    _, paths = fingerprint_payload({"a": {"b": {"c": 1}}}, max_depth=1)
+    assert paths == ["a", "a.b"]
+
+
+def test_fingerprint_hash_is_stable():
+    # Stored fingerprint hashes must not change, or every provider reports drift on the next run.
+    h, _ = fingerprint_payload({"data": {"products": [{"productId": "p1"}]}})
+    assert h == "1bad309a36f1b7c91e122db413efe88886e167ca12bae456bc9da7ce7fb051ce"
+
+
+def test_cached_fingerprint_reuses_result_for_same_payload_hash():
+    first = _cached_fingerprint({"a": 1}, "hash-1")
+    # The payload is not re-walked on a hit, so a different object under the same hash returns the cached result.
+    assert _cached_fingerprint({"b": 2}, "hash-1") is first
+    assert _cached_fingerprint({"b": 2}, None)[1] == ["b"]
+
+
+def test_distinct_observed_at_moves_ties_forward_per_endpoint():
+    t = datetime(2026, 2, 10, tzinfo=timezone.utc)
+    us = timedelta(microseconds=1)
+    rows = [
+        ("p1", "detail", "h1", "[]", t, "run", "note"),
+        ("p1", "detail", "h2", "[]", t, "run", "note"),
+        ("p1", "detail", "h3", "[]", t + us, "run", "note"),
+        ("p2", "detail", "h4", "[]", t, "run", "note"),
+    ]
+    ordered = _distinct_observed_at(rows)
+    assert [(r[0], r[2], r[4]) for r in ordered] == [
+        ("p1", "h1", t),
+        ("p1", "h2", t + us),
+        ("p2", "h4", t),
+        ("p1", "h3", t + 2 * us),
+    ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import datetime
 
 from cdr_pipeline import ingest
@@ -9,7 +10,7 @@ class DummyConn:
     def __init__(self) -> None:
         self.commits = 0
         self.rollbacks = 0
-        self.closed = False
+        self.released = False
 
     def commit(self) -> None:
         self.commits += 1
@@ -17,8 +18,6 @@ class DummyConn:
     def rollback(self) -> None:
         self.rollbacks += 1
 
-    def close(self) -> None:
-        self.closed = True
 
 
 class DummySession:
@@ -32,29 +31,32 @@ class DummySession:
 def test_run_ingest_smoke(monkeypatch):
     conn = DummyConn()
     session = DummySession()
-    recorded = {"execute_calls": 0, "execute_batch_calls": 0, "brands_processed": 0}
+    recorded = {"execute_calls": 0, "execute_values_calls": 0, "brands_processed": 0, "autocommit": []}
 
     def fake_bootstrap_db(force: bool = False) -> None:
         assert force is False
 
-    def fake_connect_with_retries(dsn: str, retries: int = 30, sleep_seconds: float = 1.0, autocommit: bool = False):
+    @contextmanager
+    def fake_pooled(dsn: str, *, autocommit: bool = False, maxconn: int = 4):
         assert "dbname=" in dsn
-        assert autocommit is False
-        return conn
+        recorded["autocommit"].append(autocommit)
+        yield conn
+        conn.released = True
 
-    def fake_build_session(retry_total: int, backoff_factor: float, user_agent: str):
+    def fake_build_session(retry_total: int, backoff_factor: float, user_agent: str, pool_maxsize: int = 20):
         assert retry_total >= 0
         assert backoff_factor >= 0
         assert user_agent
+        assert pool_maxsize >= 1
         return session
 
     def fake_execute(_conn, _sql, _params=None):
         recorded["execute_calls"] += 1
 
-    def fake_execute_batch(_conn, _sql, rows):
+    def fake_execute_values(_conn, _sql, rows, template=None, page_size=500):
         rows = list(rows)
         assert rows
-        recorded["execute_batch_calls"] += 1
+        recorded["execute_values_calls"] += 1
 
     def fake_discover_brands(_cfg, _session, _conn, _run_id, _run_date):
         return [
@@ -72,19 +74,21 @@ def test_run_ingest_smoke(monkeypatch):
         return 1, {"p1"}
 
     monkeypatch.setattr(ingest, "bootstrap_db", fake_bootstrap_db)
-    monkeypatch.setattr(ingest, "connect_with_retries", fake_connect_with_retries)
+    monkeypatch.setattr(ingest, "pooled", fake_pooled)
     monkeypatch.setattr(ingest, "build_session", fake_build_session)
     monkeypatch.setattr(ingest, "execute", fake_execute)
-    monkeypatch.setattr(ingest, "execute_batch", fake_execute_batch)
+    monkeypatch.setattr(ingest, "execute_values", fake_execute_values)
     monkeypatch.setattr(ingest, "_discover_brands", fake_discover_brands)
     monkeypatch.setattr(ingest, "_fetch_products_for_brand", fake_fetch_products_for_brand)
 
     ingest.run_ingest(datetime(2026, 2, 10))
 
     assert recorded["execute_calls"] >= 1
-    assert recorded["execute_batch_calls"] == 1
+    assert recorded["execute_values_calls"] == 1
     assert recorded["brands_processed"] == 1
+    # pipeline_run row on an autocommit connection; discovery and each brand in their own transaction.
+    assert recorded["autocommit"] == [True, False, False]
     assert conn.commits >= 2
     assert conn.rollbacks == 0
-    assert conn.closed is True
+    assert conn.released is True
     assert session.closed is True
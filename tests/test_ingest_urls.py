@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from urllib.parse import urljoin
+
+from cdr_pipeline.ingest import _join_base, _resolve_next_url
+
+
+def test_resolve_next_url_absolute_and_host_relative():
+    current = "https://api.example.com/cds-au/v1/banking/products?page=1"
+    assert _resolve_next_url(current, "") == ""
+    assert _resolve_next_url(current, "https://other.example.com/p?page=2") == "https://other.example.com/p?page=2"
+    assert _resolve_next_url(current, "/cds-au/v1/banking/products?page=2") == (
+        "https://api.example.com/cds-au/v1/banking/products?page=2"
+    )
+
+
+def test_resolve_next_url_falls_back_to_urljoin():
+    current = "https://api.example.com/cds-au/v1/banking/products?page=1"
+    for nxt in ("products?page=2", "/a/../products?page=2", "//cdn.example.com/p", "/p?#"):
+        assert _resolve_next_url(current, nxt) == urljoin(current, nxt)
+
+
+def test_join_base_matches_urljoin():
+    for base, path in [
+        ("https://api.example.com/", "cds-au/v1/banking/products"),
+        ("https://api.example.com/bank/", "cds-au/v1/banking/products/p-1"),
+        ("https://api.example.com/", "../products"),
+        ("https://api.example.com/?x=1/", "products"),
+    ]:
+        assert _join_base(base, path) == urljoin(base, path)
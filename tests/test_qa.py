@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from cdr_pipeline.qa import _clip_text, _gate_max, _gate_min, _run_dbt_tests
+import sys
+from types import SimpleNamespace
+
+from cdr_pipeline import qa
+from cdr_pipeline.qa import _clip_text, _gate_max, _gate_min, _run_dbt_tests, _schema_drift_result, _with_dbt_threads
 
 
 def test_clip_text_short_no_change():
@@ -21,7 +25,45 @@ def test_gate_max_pass_and_fail():
     assert _gate_max("x", 10, 5).passed is False
 
 
+def test_schema_drift_result_fails_only_when_enabled():
+    assert _schema_drift_result(2.0, True).passed is False
+    assert _schema_drift_result(0.0, True).passed is True
+    disabled = _schema_drift_result(2.0, False)
+    assert disabled.passed is True
+    assert disabled.threshold_value is None
+
+
 def test_run_dbt_tests_empty_command_fails():
     ok, details = _run_dbt_tests("")
     assert ok is False
     assert "empty" in details
+
+
+def test_run_dbt_tests_in_process_collects_dbt_log(monkeypatch):
+    class FakeRunner:
+        def __init__(self, callbacks):
+            self.callbacks = callbacks
+
+        def invoke(self, args):
+            events = [
+                SimpleNamespace(info=SimpleNamespace(level="debug", msg="Acquiring new postgres connection")),
+                SimpleNamespace(info=SimpleNamespace(level="info", msg=f"ran {' '.join(args)}")),
+                SimpleNamespace(info=SimpleNamespace(level="error", msg="1 of 2 FAIL not_null")),
+            ]
+            for event in events:
+                for cb in self.callbacks:
+                    cb(event)
+            return SimpleNamespace(success=False, exception=None)
+
+    monkeypatch.setitem(sys.modules, "dbt.cli.main", SimpleNamespace(dbtRunner=FakeRunner))
+    monkeypatch.setattr(qa, "_dbt_runner", None)
+    ok, details = _run_dbt_tests("dbt test --project-dir dbt")
+    assert ok is False
+    assert details == "exit_code=1\nran test --project-dir dbt\n1 of 2 FAIL not_null"
+
+
+def test_with_dbt_threads_appends_unless_set():
+    assert _with_dbt_threads("dbt test --project-dir dbt", 8) == "dbt test --project-dir dbt --threads 8"
+    assert _with_dbt_threads("dbt test --threads 2", 8) == "dbt test --threads 2"
+    assert _with_dbt_threads("dbt test", 0) == "dbt test"
+    assert _with_dbt_threads("make dbt-test", 8) == "make dbt-test"